@@ -7,10 +7,40 @@ import re
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime
-from playwright.async_api import async_playwright, Page, Browser
+from playwright.async_api import async_playwright, Browser
 
 logger = logging.getLogger(__name__)
 
+# All social platforms in one alternation, so each href is checked in a single search
+SOCIAL_DOMAIN_PATTERN = re.compile(
+    r'facebook\.com|twitter\.com|linkedin\.com|instagram\.com|youtube\.com|tiktok\.com|pinterest\.com',
+    re.IGNORECASE
+)
+
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+VALID_TLD_PATTERN = re.compile(r'\.(com|org|net|edu|gov|mil|co|io|ai|dev|app|tech|info|biz)$')
+PHONE_PATTERNS = [
+    re.compile(r'\+?1?\s*\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})'),  # US
+    re.compile(r'\+?([0-9]{1,3})\s*\(?([0-9]{2,4})\)?[-.\s]?([0-9]{3,4})[-.\s]?([0-9]{4})'),  # International
+]
+ADDRESS_PATTERN = re.compile(
+    r'\d+\s+[\w\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Circle|Cir|Way)[,\s]+[\w\s]+,\s*[A-Z]{2}\s*\d{5}',
+    re.IGNORECASE
+)
+
+# Everything the extractors read from the page, fetched in one browser round-trip
+PAGE_SNAPSHOT_JS = """() => {
+    const meta = document.querySelector('meta[name="description"]');
+    return {
+        title: document.title,
+        html: document.documentElement ? document.documentElement.outerHTML : '',
+        text: document.body ? document.body.innerText : null,
+        hrefs: Array.from(document.querySelectorAll('a[href]'))
+            .slice(0, 100).map(e => e.getAttribute('href')),
+        meta_description: meta ? meta.getAttribute('content') || '' : ''
+    };
+}"""
+
 
 class AsyncWebsiteScraper:
     """Async scraper using Playwright async API"""
@@ -67,16 +97,17 @@ class AsyncWebsiteScraper:
             await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
             await page.wait_for_timeout(200)
             
-            # Extract data
-            title = await page.title()
-            content = await page.content()
+            # Extract data (title, HTML, visible text, links and meta in one call)
+            snapshot = await page.evaluate(PAGE_SNAPSHOT_JS)
+            title = snapshot['title']
+            content = snapshot['html']
             
-            # Also get visible text for better extraction
-            try:
-                visible_text = await page.evaluate('document.body.innerText')
+            # Also use visible text for better extraction
+            visible_text = snapshot['text']
+            if visible_text is not None:
                 # Combine HTML and visible text for better extraction
                 full_content = content + '\n' + visible_text
-            except:
+            else:
                 full_content = content
             
             # Extract emails
@@ -86,16 +117,13 @@ class AsyncWebsiteScraper:
             phones = self._extract_phones(full_content)
             
             # Extract social links
-            social_links = await self._extract_social_links(page)
+            social_links = self._extract_social_links(snapshot['hrefs'])
             
             # Extract address
             address = self._extract_address(full_content)
             
             # Extract metadata
-            try:
-                meta_desc = await page.locator('meta[name="description"]').get_attribute('content', timeout=5000) or ''
-            except:
-                meta_desc = ''
+            meta_desc = snapshot['meta_description']
             
             # Calculate confidence
             confidence = self._calculate_confidence(emails, phones, social_links)
@@ -141,8 +169,7 @@ class AsyncWebsiteScraper:
     
     def _extract_emails(self, content: str) -> List[str]:
         """Extract email addresses from content"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = list(set(re.findall(email_pattern, content)))
+        emails = list(set(EMAIL_PATTERN.findall(content)))
         
         # Filter out common false positives and invalid emails
         filtered = []
@@ -168,7 +195,7 @@ class AsyncWebsiteScraper:
                 continue
             
             # Must have valid TLD (top level domain)
-            if not re.search(r'\.(com|org|net|edu|gov|mil|co|io|ai|dev|app|tech|info|biz)$', email_lower):
+            if not VALID_TLD_PATTERN.search(email_lower):
                 continue
             
             # Skip if it looks like a file path or URL parameter
@@ -181,13 +208,9 @@ class AsyncWebsiteScraper:
     
     def _extract_phones(self, content: str) -> List[str]:
         """Extract phone numbers from content"""
-        phone_patterns = [
-            r'\+?1?\s*\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})',  # US
-            r'\+?([0-9]{1,3})\s*\(?([0-9]{2,4})\)?[-.\s]?([0-9]{3,4})[-.\s]?([0-9]{4})',  # International
-        ]
         phones = []
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, content)
+        for pattern in PHONE_PATTERNS:
+            matches = pattern.findall(content)
             for match in matches:
                 if isinstance(match, tuple):
                     phone = ''.join(match)
@@ -225,29 +248,16 @@ class AsyncWebsiteScraper:
         
         return list(set(phones))[:10]  # Limit to 10
     
-    async def _extract_social_links(self, page: Page) -> List[str]:
-        """Extract social media links"""
-        social_domains = ['facebook.com', 'twitter.com', 'linkedin.com', 'instagram.com', 
-                         'youtube.com', 'tiktok.com', 'pinterest.com']
-        
-        links = await page.locator('a[href]').all()
-        social_links = []
-        
-        for link in links[:100]:  # Limit to first 100 links
-            try:
-                href = await link.get_attribute('href')
-                if href and any(domain in href.lower() for domain in social_domains):
-                    social_links.append(href)
-            except:
-                continue
+    def _extract_social_links(self, hrefs: List[str]) -> List[str]:
+        """Extract social media links from the page's first 100 hrefs"""
+        social_links = [href for href in hrefs if href and SOCIAL_DOMAIN_PATTERN.search(href)]
         
         return list(set(social_links))[:10]  # Limit to 10
     
     def _extract_address(self, content: str) -> str:
         """Extract address from content"""
         # Simple address extraction - look for common patterns
-        address_pattern = r'\d+\s+[\w\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Circle|Cir|Way)[,\s]+[\w\s]+,\s*[A-Z]{2}\s*\d{5}'
-        matches = re.findall(address_pattern, content, re.IGNORECASE)
+        matches = ADDRESS_PATTERN.findall(content)
         return matches[0] if matches else ''
     
     def _calculate_confidence(self, emails: List, phones: List, socials: List) -> float:
@@ -30,19 +30,49 @@ Author: Generated via Kiro Spec-Driven Development
 
 import re
 import csv
+import sys
 import time
+import random
+import atexit
+import operator
 import asyncio
+import threading
 from datetime import datetime
-from dataclasses import dataclass, asdict
-from typing import List, Union, Optional, Dict
+from dataclasses import dataclass, field
+from typing import List, Union, Optional, Dict, Tuple
 from pathlib import Path
+from collections import deque
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
 
 try:
-    from playwright.sync_api import sync_playwright, Browser, Page, TimeoutError as PlaywrightTimeout
+    from playwright.sync_api import sync_playwright, Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeout
 except ImportError:
     print("Error: Playwright not installed. Run: pip install playwright && playwright install chromium")
     exit(1)
 
+# Optional: Aho-Corasick matcher for the keyword classifiers (pip install pyahocorasick)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional: faster JSON-LD parsing (pip install orjson)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    import json
+    ORJSON_AVAILABLE = False
+
+# Optional: HEAD pre-flight that skips dead URLs before a browser loads them (pip install aiohttp)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 
 # ============================================================================
 # DATA MODELS
@@ -56,7 +86,7 @@ class ProxyConfig:
     password: Optional[str] = None  # Optional authentication
 
 
-@dataclass
+@dataclass(slots=True)  # No per-instance __dict__; one record is kept per URL
 class ScrapedData:
     """Container for all extracted website data"""
     url: str
@@ -87,6 +117,73 @@ class ScrapedData:
     social_count: int
 
 
+@dataclass
+class PageExtractions:
+    """Raw pattern matches collected from a single scan of the page HTML"""
+    emails: List[str] = field(default_factory=list)
+    phones: List[str] = field(default_factory=list)
+    social_links: List[str] = field(default_factory=list)
+    messaging: Dict[str, str] = field(default_factory=dict)  # First link per platform
+
+
+@dataclass
+class PageCtx:
+    """Page state fetched from the browser once and shared by every extractor"""
+    raw: str  # Text the patterns scan: visible body text plus every link href
+    lower: str  # Lowercased raw
+    body_text: str  # Visible body text
+    links: List[str]  # Absolute href of every link
+    dom: Dict  # Full EXTRACT_JS snapshot (meta tags, JSON-LD, itemprops, ...)
+    url: str
+    url_lower: str
+
+
+@dataclass
+class ContentSignals:
+    """Keyword-based classifications collected from a single pass over the page HTML"""
+    industry: str = "General"
+    blog_keywords: bool = False
+    products_or_services: bool = False
+
+
+# ============================================================================
+# PROGRESS OUTPUT
+# ============================================================================
+
+# Per-thread buffer of progress lines. Browser workers collect a URL's lines
+# here and write them as one block, so concurrent URLs do not interleave.
+_progress = threading.local()
+
+
+def log_progress(message: str = ""):
+    """
+    Print a progress line, or buffer it if this thread is collecting output.
+    
+    Args:
+        message: Line to output
+    """
+    lines = getattr(_progress, 'lines', None)
+    if lines is None:
+        print(message)
+    else:
+        lines.append(message)
+
+
+def begin_progress():
+    """Start buffering this thread's progress lines."""
+    _progress.lines = []
+
+
+def flush_progress():
+    """Write this thread's buffered progress lines in a single call and stop buffering."""
+    lines = getattr(_progress, 'lines', None)
+    _progress.lines = None
+    if lines:
+        lines.append('')
+        sys.stdout.write('\n'.join(lines))
+        sys.stdout.flush()
+
+
 # ============================================================================
 # PROXY MANAGEMENT
 # ============================================================================
@@ -96,6 +193,7 @@ _proxy_index = 0
 _proxies_cache = []
 _proxy_usage_count = 0  # Track how many times current proxy has been used
 _max_uses_per_proxy = 7  # Rotate proxy after this many uses
+_proxy_lock = threading.Lock()  # Rotation state is shared by concurrent browser workers
 
 
 def load_proxies(filename: str = "proxies.txt") -> List[ProxyConfig]:
@@ -145,6 +243,10 @@ def load_proxies(filename: str = "proxies.txt") -> List[ProxyConfig]:
     return proxies
 
 
+_PROXY_AUTH_PATTERN = re.compile(r'http://([^:]+):([^@]+)@([^:]+):(\d+)')
+_PROXY_PATTERN = re.compile(r'http://([^:]+):(\d+)')
+
+
 def parse_proxy_line(line: str) -> Optional[ProxyConfig]:
     """
     Parse a single proxy line and detect its format.
@@ -165,7 +267,7 @@ def parse_proxy_line(line: str) -> Optional[ProxyConfig]:
     
     # Format 4: http://user:pass@ip:port
     if line.startswith('http://') and '@' in line:
-        match = re.match(r'http://([^:]+):([^@]+)@([^:]+):(\d+)', line)
+        match = _PROXY_AUTH_PATTERN.match(line)
         if match:
             username, password, ip, port = match.groups()
             return ProxyConfig(
@@ -176,7 +278,7 @@ def parse_proxy_line(line: str) -> Optional[ProxyConfig]:
     
     # Format 3: http://ip:port
     elif line.startswith('http://'):
-        match = re.match(r'http://([^:]+):(\d+)', line)
+        match = _PROXY_PATTERN.match(line)
         if match:
             ip, port = match.groups()
             return ProxyConfig(server=f"http://{ip}:{port}")
@@ -220,17 +322,18 @@ def get_next_proxy(force_rotate: bool = False) -> Optional[ProxyConfig]:
     if not _proxies_cache:
         return None
     
-    # Check if we should rotate to next proxy
-    should_rotate = force_rotate or _proxy_usage_count >= _max_uses_per_proxy
-    
-    if should_rotate and len(_proxies_cache) > 1:
-        # Move to next proxy
-        _proxy_index = (_proxy_index + 1) % len(_proxies_cache)
-        _proxy_usage_count = 0
-        print(f"[*] Proxy rotated (used {_max_uses_per_proxy} times, switching for safety)")
-    
-    proxy = _proxies_cache[_proxy_index]
-    _proxy_usage_count += 1
+    with _proxy_lock:
+        # Check if we should rotate to next proxy
+        should_rotate = force_rotate or _proxy_usage_count >= _max_uses_per_proxy
+        
+        if should_rotate and len(_proxies_cache) > 1:
+            # Move to next proxy
+            _proxy_index = (_proxy_index + 1) % len(_proxies_cache)
+            _proxy_usage_count = 0
+            log_progress(f"[*] Proxy rotated (used {_max_uses_per_proxy} times, switching for safety)")
+        
+        proxy = _proxies_cache[_proxy_index]
+        _proxy_usage_count += 1
     
     return proxy
 
@@ -264,71 +367,33 @@ def format_proxy_for_playwright(proxy_config: Optional[ProxyConfig]) -> Optional
 
 
 # ============================================================================
-# URL VALIDATION AND USER INPUT
+# BROWSER MANAGEMENT
 # ============================================================================
 
-def validate_url(url: str) -> bool:
-    """
-    Validate URL format using regex.
-    
-    Accepts URLs with:
-    - http:// or https:// protocol
-    - Valid domain name
-    - Valid TLD (2+ characters)
-    - Optional path, query, and fragment
-    
-    Args:
-        url: URL string to validate
-        
-    Returns:
-        True if URL is valid, False otherwise
-        
-    Examples:
-        >>> validate_url("https://example.com")
-        True
-        >>> validate_url("http://sub.example.com/path")
-        True
-        >>> validate_url("not-a-url")
-        False
-    """
-    # URL validation regex pattern
-    # Matches: http(s)://domain.tld with optional path/query/fragment
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$',  # optional path
-        re.IGNORECASE
+# Page height, viewport height and whether the page shows signs of content
+# that only appears on scroll (lazy-loaded media or a client-rendered app root)
+_SCROLL_PROBE_JS = """() => ({
+    height: document.body ? document.body.scrollHeight : 0,
+    viewport: window.innerHeight,
+    dynamic: !!document.querySelector(
+        'img[loading="lazy"], iframe[loading="lazy"], [data-src], [data-srcset], [data-lazy], '
+        + '#__next, #__nuxt, #root, #app, [data-reactroot], [ng-version]'
     )
-    
-    return bool(url_pattern.match(url))
+})"""
 
 
-def get_user_input() -> str:
-    """
-    Prompt user for website URL and validate input.
-    
-    Displays prompt "Enter the website URL to scrape:" and validates
-    the entered URL. Re-prompts on invalid input until valid URL received.
-    
-    Returns:
-        Valid URL string
-    """
-    while True:
-        url = input("Enter the website URL to scrape: ").strip()
-        
-        if validate_url(url):
-            return url
-        else:
-            print("[X] Error: Invalid URL format. Please enter a valid URL (e.g., https://example.com)")
-            print()
+# Subresources no extractor reads. Stylesheets still load: innerText and the
+# popup visibility checks depend on computed styles.
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
 
 
-# ============================================================================
-# BROWSER MANAGEMENT
-# ============================================================================
+def _block_heavy_resources(route):
+    """Abort requests for images, fonts and media; let everything else through."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
 
 class BrowserManager:
     """Manages Playwright browser lifecycle and page operations"""
@@ -343,6 +408,7 @@ class BrowserManager:
         self.proxy_config = proxy_config
         self.playwright = None
         self.browser: Optional[Browser] = None
+        self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         
     def launch_browser(self):
@@ -352,9 +418,9 @@ class BrowserManager:
         Configures:
         - Headless mode (headless=True) for background operation
         - 30-second timeout
-        - Proxy settings if provided
+        - Proxy settings if provided (applied per context, see new_context)
         """
-        print("[*] Launching browser...")
+        log_progress("[*] Launching browser...")
         
         self.playwright = sync_playwright().start()
         
@@ -364,20 +430,49 @@ class BrowserManager:
             'timeout': 30000,   # 30 second timeout
         }
         
-        # Add proxy if configured
-        proxy_dict = format_proxy_for_playwright(self.proxy_config)
-        if proxy_dict:
-            launch_args['proxy'] = proxy_dict
-            print(f"   Using proxy: {proxy_dict['server']}")
-        
         # Launch browser
         self.browser = self.playwright.chromium.launch(**launch_args)
         
+        self.new_context(self.proxy_config)
+        
+        log_progress("[+] Browser launched successfully")
+    
+    def new_context(self, proxy_config: Optional[ProxyConfig] = None):
+        """
+        Open a fresh browser context (and page) on the running browser.
+        
+        Any current context is closed first. Contexts are isolated like
+        separate browser profiles (cookies, storage, proxy), so rotating the
+        proxy this way avoids a Chromium relaunch.
+        
+        Args:
+            proxy_config: Optional proxy configuration for the new context
+        """
+        self.close_context()
+        self.proxy_config = proxy_config
+        
+        context_args = {}
+        proxy_dict = format_proxy_for_playwright(proxy_config)
+        if proxy_dict:
+            context_args['proxy'] = proxy_dict
+            log_progress(f"   Using proxy: {proxy_dict['server']}")
+        
+        self.context = self.browser.new_context(**context_args)
+        self.context.route('**/*', _block_heavy_resources)
+        
         # Create new page with timeout
-        self.page = self.browser.new_page()
+        self.page = self.context.new_page()
         self.page.set_default_timeout(30000)  # 30 second timeout for all operations
-        
-        print("[+] Browser launched successfully")
+    
+    def close_context(self):
+        """Close the current context and its page, keeping the browser running."""
+        try:
+            if self.context:
+                self.context.close()
+        except Exception as e:
+            log_progress(f"[!] Error closing context: {str(e)}")
+        self.context = None
+        self.page = None
         
     def handle_popups(self):
         """
@@ -435,7 +530,7 @@ class BrowserManager:
                     continue  # Element not found or not clickable
             
             if clicked_count > 0:
-                print(f"[+] Closed {clicked_count} popup(s)")
+                log_progress(f"[+] Closed {clicked_count} popup(s)")
             
             # Also try pressing Escape key (works for many modals)
             try:
@@ -461,37 +556,37 @@ class BrowserManager:
         """
         for attempt in range(1, max_retries + 1):
             try:
-                print(f"[*] Loading page (attempt {attempt}/{max_retries})...")
+                log_progress(f"[*] Loading page (attempt {attempt}/{max_retries})...")
                 
                 # Navigate to URL and wait for network idle
                 self.page.goto(url, wait_until='networkidle', timeout=30000)
                 
                 # Handle popups immediately after page load
-                print("[*] Checking for popups...")
+                log_progress("[*] Checking for popups...")
                 self.handle_popups()
                 
-                print("[+] Page loaded successfully")
+                log_progress("[+] Page loaded successfully")
                 return True
                 
             except PlaywrightTimeout:
-                print(f"[!] Timeout on attempt {attempt}")
+                log_progress(f"[!] Timeout on attempt {attempt}")
                 if attempt < max_retries:
                     # Exponential backoff: 2^attempt seconds
                     wait_time = 2 ** attempt
-                    print(f"   Retrying in {wait_time} seconds...")
+                    log_progress(f"   Retrying in {wait_time} seconds...")
                     time.sleep(wait_time)
                 else:
-                    print("[X] Failed to load page after all retries")
+                    log_progress("[X] Failed to load page after all retries")
                     return False
                     
             except Exception as e:
-                print(f"[!] Error on attempt {attempt}: {str(e)}")
+                log_progress(f"[!] Error on attempt {attempt}: {str(e)}")
                 if attempt < max_retries:
                     wait_time = 2 ** attempt
-                    print(f"   Retrying in {wait_time} seconds...")
+                    log_progress(f"   Retrying in {wait_time} seconds...")
                     time.sleep(wait_time)
                 else:
-                    print("[X] Failed to load page after all retries")
+                    log_progress("[X] Failed to load page after all retries")
                     return False
         
         return False
@@ -501,13 +596,20 @@ class BrowserManager:
         Smoothly scroll to bottom of page to trigger lazy-loaded content.
         
         Uses incremental scrolling with delays to ensure dynamic content loads.
+        Static pages (no lazy-load or client-rendering markers) and pages that
+        fit in the viewport have nothing to reveal and are not scrolled.
         """
-        print("[*] Scrolling page to load dynamic content...")
-        
         try:
-            # Get page height
-            page_height = self.page.evaluate("document.body.scrollHeight")
-            viewport_height = self.page.evaluate("window.innerHeight")
+            # Get page height and dynamic-content markers in one call
+            probe = self.page.evaluate(_SCROLL_PROBE_JS)
+            page_height = probe['height']
+            viewport_height = probe['viewport']
+            
+            if not probe['dynamic'] or page_height <= viewport_height:
+                log_progress("[*] Static page, skipping scroll")
+                return
+            
+            log_progress("[*] Scrolling page to load dynamic content...")
             
             # Scroll incrementally
             current_position = 0
@@ -528,10 +630,10 @@ class BrowserManager:
             # Handle any popups that appeared during scrolling
             self.handle_popups()
             
-            print("[+] Scrolling complete")
+            log_progress("[+] Scrolling complete")
             
         except Exception as e:
-            print(f"[!] Scrolling error: {str(e)}")
+            log_progress(f"[!] Scrolling error: {str(e)}")
             # Continue anyway - not critical
     
     def close_browser(self):
@@ -541,96 +643,218 @@ class BrowserManager:
         Ensures cleanup happens even on errors.
         """
         try:
-            if self.page:
-                self.page.close()
+            self.close_context()
             if self.browser:
                 self.browser.close()
             if self.playwright:
                 self.playwright.stop()
-            print("[+] Browser closed")
+            log_progress("[+] Browser closed")
         except Exception as e:
-            print(f"[!] Error closing browser: {str(e)}")
+            log_progress(f"[!] Error closing browser: {str(e)}")
 
 
 # ============================================================================
 # DATA EXTRACTION
 # ============================================================================
 
+# Every contact/link pattern fused into a single alternation so the page text
+# is scanned once. Each alternative is wrapped in a named group; match.lastgroup
+# tells scan_page() which category fired.
+# Email TLD, excluding file extensions that look like one (image/asset names).
+# It must be the domain's last label: no further ".label" may follow, so
+# sprite@2x.min.js can't match as sprite@2x.min (a sentence's full stop may).
+_EMAIL_TLD = r'(?!(?i:png|jpe?g|gif|css|js|svg|webp)\b)[a-zA-Z]{2,}+(?!\.?[\w-])'
+
+_COMBINED_PATTERN = re.compile(
+    # Emails (obfuscated "[dot]" form first, it shares a prefix with the standard form).
+    # \b fences skip start positions inside words; possessive runs never backtrack.
+    # The TLD lookahead rejects asset names like logo@2x.png at match time.
+    r'(?P<email_dot>\b(?P<dot_local>[a-zA-Z0-9._%+-]++@[a-zA-Z0-9-]++)\s*[\[\(]?\s*(?i:dot)\s*[\]\)]?\s*(?P<dot_tld>' + _EMAIL_TLD + r'))'
+    r'|(?P<email>\b[a-zA-Z0-9._%+-]++@(?:[a-zA-Z0-9-]++\.)+' + _EMAIL_TLD + r')'
+    r'|(?P<email_at>\b(?P<at_user>[a-zA-Z0-9._%+-]++)\s*[\[\(]?\s*(?i:at)\s*[\]\)]?\s*(?P<at_domain>(?:[a-zA-Z0-9-]++\.)+' + _EMAIL_TLD + r'))'
+    # Social media profiles
+    r'|(?P<social>https?://(?:www\.)?(?:facebook|instagram|twitter|x|tiktok|linkedin|youtube|pinterest|snapchat)\.com/[^\s"\'>]++)'
+    # Messaging apps
+    r'|(?P<whatsapp>https?://(?:wa\.me|api\.whatsapp\.com|chat\.whatsapp\.com)/[^\s"\'>]++)'
+    r'|(?P<telegram>https?://(?:t\.me|telegram\.me|telegram\.org)/[^\s"\'>]++)'
+    r'|(?P<signal>https?://signal\.(?:group|me)/[^\s"\'>]++)'
+    r'|(?P<discord>https?://(?:discord\.gg|discord\.com/invite)/[^\s"\'>]++)'
+    # Phones: international, then US (a bare 10-digit run is covered by the US form)
+    r'|(?P<phone_intl>\+\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}\b)'
+    r'|(?P<phone_us>(?:\(\d{3}\)|\b\d{3})[-.\s]?\d{3}[-.\s]?\d{4}\b)'
+)
+
+_MESSAGING_GROUPS = ('whatsapp', 'telegram', 'signal', 'discord')
+
+
+def scan_page(content: str) -> PageExtractions:
+    """
+    Scan page text once and bucket every contact/link match by category.
+
+    Replaces the separate per-extractor regex passes: the combined pattern
+    walks the text a single time and each match is dispatched on the name
+    of the group that fired.
+
+    Args:
+        content: Page text to scan (PageCtx.raw: visible text plus link hrefs)
+
+    Returns:
+        PageExtractions with raw (unvalidated) matches in document order
+    """
+    extractions = PageExtractions()
+
+    for match in _COMBINED_PATTERN.finditer(content):
+        kind = match.lastgroup
+
+        if kind == 'email':
+            extractions.emails.append(match.group())
+        elif kind == 'email_at':
+            extractions.emails.append(f"{match.group('at_user')}@{match.group('at_domain')}")
+        elif kind == 'email_dot':
+            extractions.emails.append(f"{match.group('dot_local')}.{match.group('dot_tld')}")
+        elif kind == 'social':
+            extractions.social_links.append(match.group())
+        elif kind in _MESSAGING_GROUPS:
+            extractions.messaging.setdefault(kind, match.group())
+        else:
+            extractions.phones.append(match.group())
+
+    return extractions
+
+
+# Everything the extractors need, pulled in one round-trip to the browser.
+# Patterns then run on visible text and hrefs instead of the serialized HTML.
+EXTRACT_JS = """() => {
+    const attr = (selector) => document.querySelector(selector)?.getAttribute('content') || '';
+    const text = (prop) => document.querySelector(`[itemprop="${prop}"]`)?.innerText || '';
+    // First description selector (in priority order) whose first 3 matches give substantial text
+    const description = () => {
+        const selectors = [
+            '.description', '#description', '.about', '#about',
+            '[class*="description"]', '[class*="about"]',
+            'p',  // Fallback to first few paragraphs
+        ];
+        for (const selector of selectors) {
+            const els = Array.from(document.querySelectorAll(selector)).slice(0, 3);
+            if (els.length) {
+                const combined = els.map(e => e.innerText).join(' ').trim();
+                if (combined.length > 50) return combined.slice(0, 500);
+            }
+        }
+        return '';
+    };
+    return {
+        title: document.title,
+        text: document.body ? document.body.innerText : '',
+        links: Array.from(document.querySelectorAll('a[href]'), a => a.href),
+        meta_description: attr('meta[name="description"]'),
+        og_title: attr('meta[property="og:title"]'),
+        og_description: attr('meta[property="og:description"]'),
+        og_image: attr('meta[property="og:image"]'),
+        og_type: attr('meta[property="og:type"]'),
+        json_ld: Array.from(document.querySelectorAll('script[type="application/ld+json"]'), s => s.textContent),
+        street: text('streetAddress'),
+        city: text('addressLocality'),
+        state: text('addressRegion'),
+        zip: text('postalCode'),
+        country: text('addressCountry'),
+        has_contact_form: !!document.querySelector(
+            'form, input[type="email"], textarea, input[name*="message"], input[name*="contact"]'
+        ),
+        description: description(),
+    };
+}"""
+
+
 def extract_url(page: Page) -> str:
     """Extract the current page URL"""
     return page.url
 
 
-def extract_title(page: Page) -> str:
+def extract_title(page: Page, ctx: Optional[PageCtx] = None) -> str:
     """Extract page title"""
     try:
+        if ctx is not None:
+            return ctx.dom.get('title') or ""
         return page.title() or ""
     except:
         return ""
 
 
-def extract_metadata(page: Page) -> Dict[str, str]:
+def read_page_ctx(page: Page) -> PageCtx:
+    """
+    Snapshot everything the extractors need with a single page.evaluate().
+    
+    Replaces page.content() plus the per-field locator calls: the browser
+    returns visible text, link hrefs, meta tags, JSON-LD and address
+    itemprops in one JSON object, and the pattern scans run over that
+    much smaller text instead of the full HTML.
+    
+    Returns:
+        PageCtx for the page
+    """
+    dom = page.evaluate(EXTRACT_JS) or {}
+    body_text = dom.get('text') or ""
+    links = [href for href in dom.get('links') or [] if href]
+    
+    # Hrefs keep mailto:/tel: targets and social profile URLs in the scan
+    raw = body_text + '\n' + '\n'.join(links)
+    url = page.url
+    return PageCtx(raw=raw, lower=raw.lower(), body_text=body_text, links=links, dom=dom,
+                   url=url, url_lower=url.lower())
+
+
+def parse_json_ld(scripts: List[str]) -> List:
+    """
+    Parse every JSON-LD script block, skipping any that are malformed.
+    
+    Uses orjson when installed, falling back to the stdlib json module.
+    """
+    blocks = []
+    for text in scripts:
+        try:
+            blocks.append(orjson.loads(text) if ORJSON_AVAILABLE else json.loads(text))
+        except ValueError:  # orjson.JSONDecodeError and json.JSONDecodeError both subclass it
+            continue
+    return blocks
+
+
+def extract_metadata(page: Page, dom: Optional[Dict] = None, include_json_ld: bool = True) -> Dict[str, str]:
     """
     Extract comprehensive metadata including OpenGraph and JSON-LD.
     
+    Args:
+        page: Playwright page
+        dom: PageCtx.dom snapshot already fetched by the caller (fetched if omitted)
+        include_json_ld: Parse the JSON-LD blocks (skip when the caller doesn't use them)
+    
     Returns:
-        Dictionary with meta_description, og_data, and json_ld
+        Dictionary with meta_description, og_data, json_ld (first block)
+        and json_ld_blocks (every block)
     """
     try:
+        if dom is None:
+            dom = read_page_ctx(page).dom
         metadata = {
-            'meta_description': '',
-            'og_title': '',
-            'og_description': '',
-            'og_image': '',
-            'og_type': '',
-            'json_ld': {}
+            'meta_description': dom.get('meta_description') or '',
+            'og_title': dom.get('og_title') or '',
+            'og_description': dom.get('og_description') or '',
+            'og_image': dom.get('og_image') or '',
+            'og_type': dom.get('og_type') or '',
+            'json_ld': {},
+            'json_ld_blocks': []
         }
         
-        # Standard meta description
-        try:
-            meta_desc = page.locator('meta[name="description"]').get_attribute('content')
-            metadata['meta_description'] = meta_desc or ""
-        except:
-            pass
-        
-        # OpenGraph data
-        try:
-            og_title = page.locator('meta[property="og:title"]').get_attribute('content')
-            metadata['og_title'] = og_title or ""
-        except:
-            pass
-        
-        try:
-            og_desc = page.locator('meta[property="og:description"]').get_attribute('content')
-            metadata['og_description'] = og_desc or ""
-        except:
-            pass
-        
-        try:
-            og_image = page.locator('meta[property="og:image"]').get_attribute('content')
-            metadata['og_image'] = og_image or ""
-        except:
-            pass
-        
-        try:
-            og_type = page.locator('meta[property="og:type"]').get_attribute('content')
-            metadata['og_type'] = og_type or ""
-        except:
-            pass
-        
-        # JSON-LD structured data
-        try:
-            import json
-            json_ld_scripts = page.locator('script[type="application/ld+json"]').all()
-            if json_ld_scripts:
-                json_ld_text = json_ld_scripts[0].inner_text()
-                metadata['json_ld'] = json.loads(json_ld_text)
-        except:
-            pass
+        # JSON-LD structured data (parsed locally from the fetched script text)
+        if include_json_ld:
+            blocks = parse_json_ld(dom.get('json_ld') or [])
+            if blocks:
+                metadata['json_ld'] = blocks[0]
+                metadata['json_ld_blocks'] = blocks
         
         return metadata
     except:
-        return {'meta_description': '', 'og_title': '', 'og_description': '', 'og_image': '', 'og_type': '', 'json_ld': {}}
+        return {'meta_description': '', 'og_title': '', 'og_description': '', 'og_image': '', 'og_type': '', 'json_ld': {}, 'json_ld_blocks': []}
 
 
 def generate_timestamp() -> str:
@@ -638,7 +862,7 @@ def generate_timestamp() -> str:
     return datetime.now().isoformat()
 
 
-def extract_emails(page: Page) -> Union[List[str], str]:
+def extract_emails(page: Page, extractions: Optional[PageExtractions] = None) -> Union[List[str], str]:
     """
     Extract all email addresses from page including obfuscated formats.
     
@@ -647,47 +871,42 @@ def extract_emails(page: Page) -> Union[List[str], str]:
     - Obfuscated: user [at] example.com, user(at)example.com
     - Dot obfuscated: user [dot] example [dot] com
     
+    Args:
+        page: Playwright page (only read when extractions is not supplied)
+        extractions: Pre-computed scan_page() result for this page
+    
     Returns:
         List of unique validated emails or "NONE" if no emails found
     """
     try:
-        # Get all text content from page
-        content = page.content()
-        emails = []
-        
-        # Pattern 1: Standard email format
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        emails.extend(re.findall(email_pattern, content))
-        
-        # Pattern 2: Obfuscated with [at], (at), or " at "
-        obfuscated_at = r'([a-zA-Z0-9._%+-]+)\s*[\[\(]?\s*at\s*[\]\)]?\s*([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
-        for match in re.finditer(obfuscated_at, content, re.IGNORECASE):
-            email = f"{match.group(1)}@{match.group(2)}"
-            emails.append(email)
-        
-        # Pattern 3: Obfuscated with [dot] or (dot)
-        obfuscated_dot = r'([a-zA-Z0-9._%+-]+@[a-zA-Z0-9-]+)\s*[\[\(]?\s*dot\s*[\]\)]?\s*([a-zA-Z]{2,})'
-        for match in re.finditer(obfuscated_dot, content, re.IGNORECASE):
-            email = f"{match.group(1)}.{match.group(2)}"
-            emails.append(email)
-        
-        # Validate and clean emails
-        validated_emails = []
-        for email in emails:
+        if extractions is None:
+            extractions = scan_page(read_page_ctx(page).raw)
+        
+        # Clean and dedupe emails in one pass (asset false positives are
+        # already rejected by the pattern)
+        seen = set()
+        unique_emails = []
+        for email in extractions.emails:
             email = email.lower().strip()
-            # Basic validation: has @ and domain
-            if '@' in email and '.' in email.split('@')[1]:
-                # Remove common false positives
-                if not any(bad in email for bad in ['.png', '.jpg', '.gif', '.css', '.js']):
-                    validated_emails.append(email)
-        
-        # Remove duplicates and return
-        unique_emails = list(dict.fromkeys(validated_emails))  # Preserve order
+            if email not in seen:
+                seen.add(email)
+                unique_emails.append(email)
+        
         return unique_emails if unique_emails else "NONE"
     except:
         return "NONE"
 
 
+# Deletes everything but digits and '+' (ASCII punctuation/letters plus any
+# whitespace the phone pattern can capture) in one C-level pass
+_PHONE_DIGITS_TABLE = str.maketrans('', '', ''.join(
+    ch for ch in map(chr, range(0x3001))
+    if (ch.isascii() and not ch.isdigit() and ch != '+') or ch.isspace()
+))
+
+_YEAR_PATTERN = re.compile(r'(?:19|20)\d{2}')
+
+
 def normalize_phone(phone: str) -> str:
     """
     Normalize phone number to standard format.
@@ -699,7 +918,7 @@ def normalize_phone(phone: str) -> str:
         Normalized phone in format: +1-XXX-XXX-XXXX or original if can't normalize
     """
     # Remove all non-digit characters except +
-    digits = re.sub(r'[^\d+]', '', phone)
+    digits = phone.translate(_PHONE_DIGITS_TABLE)
     
     # Handle US numbers (10 digits)
     if len(digits) == 10:
@@ -717,7 +936,7 @@ def normalize_phone(phone: str) -> str:
     return phone
 
 
-def extract_phones(page: Page) -> Union[List[str], str]:
+def extract_phones(page: Page, extractions: Optional[PageExtractions] = None) -> Union[List[str], str]:
     """
     Extract and normalize phone numbers in various formats.
     
@@ -726,54 +945,62 @@ def extract_phones(page: Page) -> Union[List[str], str]:
     - International: +1 123 456 7890, +44 20 1234 5678
     - Extensions: 123-456-7890 ext. 123
     
+    Args:
+        page: Playwright page (only read when extractions is not supplied)
+        extractions: Pre-computed scan_page() result for this page
+    
     Returns:
         List of unique normalized phone numbers or "NONE" if none found
     """
     try:
-        content = page.content()
-        phones = []
-        
-        # Pattern 1: International format with country code
-        intl_pattern = r'\+\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}'
-        phones.extend(re.findall(intl_pattern, content))
+        if extractions is None:
+            extractions = scan_page(read_page_ctx(page).raw)
         
-        # Pattern 2: US format with parentheses
-        us_pattern1 = r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phones.extend(re.findall(us_pattern1, content))
-        
-        # Pattern 3: Simple 10-digit numbers
-        simple_pattern = r'\b\d{10}\b'
-        phones.extend(re.findall(simple_pattern, content))
-        
-        # Validate and normalize
-        validated_phones = []
-        for phone in phones:
+        # Validate, normalize and dedupe
+        seen = set()
+        unique_phones = []
+        for phone in extractions.phones:
             # Skip if too short or looks like a date/year
-            if len(re.sub(r'\D', '', phone)) < 10:
+            digits = phone.translate(_PHONE_DIGITS_TABLE)
+            if len(digits) - digits.count('+') < 10:
                 continue
-            if re.match(r'^(19|20)\d{2}', phone):  # Skip years
+            if _YEAR_PATTERN.match(phone):  # Skip years
                 continue
                 
             # Normalize and add
             normalized = normalize_phone(phone)
-            validated_phones.append(normalized)
+            if normalized not in seen:
+                seen.add(normalized)
+                unique_phones.append(normalized)
         
-        # Remove duplicates
-        unique_phones = list(dict.fromkeys(validated_phones))
         return unique_phones if unique_phones else "NONE"
     except:
         return "NONE"
 
 
-def extract_address(page: Page) -> Dict[str, str]:
+_US_ADDRESS_PATTERN = re.compile(
+    r'(\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Way))[,\s]+([A-Za-z\s]+)[,\s]+([A-Z]{2})\s+(\d{5}(?:-\d{4})?)'
+)
+
+
+def extract_address(page: Page, content: Optional[str] = None,
+                    dom: Optional[Dict] = None) -> Dict[str, str]:
     """
     Extract detailed address information with components.
     
+    Args:
+        page: Playwright page
+        content: PageCtx.raw text already fetched by the caller (fetched if omitted)
+        dom: PageCtx.dom snapshot already fetched by the caller (fetched if omitted)
+    
     Returns:
         Dictionary with street, city, state, zip, country
     """
     try:
-        content = page.content()
+        if content is None or dom is None:
+            ctx = read_page_ctx(page)
+            content = ctx.raw if content is None else content
+            dom = ctx.dom if dom is None else dom
         address_data = {
             'street': '',
             'city': '',
@@ -784,8 +1011,7 @@ def extract_address(page: Page) -> Dict[str, str]:
         }
         
         # Pattern 1: Full US address
-        us_pattern = r'(\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct|Way))[,\s]+([A-Za-z\s]+)[,\s]+([A-Z]{2})\s+(\d{5}(?:-\d{4})?)'
-        match = re.search(us_pattern, content)
+        match = _US_ADDRESS_PATTERN.search(content)
         if match:
             address_data['street'] = match.group(1).strip()
             address_data['city'] = match.group(2).strip()
@@ -797,11 +1023,11 @@ def extract_address(page: Page) -> Dict[str, str]:
         
         # Pattern 2: Schema.org markup
         try:
-            street = page.locator('[itemprop="streetAddress"]').first.inner_text() if page.locator('[itemprop="streetAddress"]').count() > 0 else ''
-            city = page.locator('[itemprop="addressLocality"]').first.inner_text() if page.locator('[itemprop="addressLocality"]').count() > 0 else ''
-            state = page.locator('[itemprop="addressRegion"]').first.inner_text() if page.locator('[itemprop="addressRegion"]').count() > 0 else ''
-            zip_code = page.locator('[itemprop="postalCode"]').first.inner_text() if page.locator('[itemprop="postalCode"]').count() > 0 else ''
-            country = page.locator('[itemprop="addressCountry"]').first.inner_text() if page.locator('[itemprop="addressCountry"]').count() > 0 else ''
+            street = dom.get('street') or ''
+            city = dom.get('city') or ''
+            state = dom.get('state') or ''
+            zip_code = dom.get('zip') or ''
+            country = dom.get('country') or ''
             
             if any([street, city, state, zip_code]):
                 address_data['street'] = street
@@ -819,133 +1045,101 @@ def extract_address(page: Page) -> Dict[str, str]:
         return {'street': '', 'city': '', 'state': '', 'zip': '', 'country': '', 'full': ''}
 
 
-def extract_social_links(page: Page) -> List[str]:
+def extract_social_links(page: Page, extractions: Optional[PageExtractions] = None) -> List[str]:
     """
     Extract social media links for specified platforms.
     
     Platforms: Facebook, Instagram, Twitter, TikTok, LinkedIn, 
                YouTube, Pinterest, Snapchat
+    
+    Args:
+        page: Playwright page (only read when extractions is not supplied)
+        extractions: Pre-computed scan_page() result for this page
     """
     try:
-        content = page.content()
-        
-        social_domains = [
-            'facebook.com',
-            'instagram.com',
-            'twitter.com',
-            'x.com',  # Twitter/X
-            'tiktok.com',
-            'linkedin.com',
-            'youtube.com',
-            'pinterest.com',
-            'snapchat.com',
-        ]
-        
-        social_links = []
-        for domain in social_domains:
-            # Find links containing the social domain
-            pattern = rf'https?://(?:www\.)?{re.escape(domain)}/[^\s"\'>]+'
-            matches = re.findall(pattern, content)
-            social_links.extend(matches)
-        
-        return list(set(social_links))
+        if extractions is None:
+            extractions = scan_page(read_page_ctx(page).raw)
+        
+        # Dedupe, keeping document order
+        seen = set()
+        unique_links = []
+        for link in extractions.social_links:
+            if link not in seen:
+                seen.add(link)
+                unique_links.append(link)
+        return unique_links
     except:
         return []
 
 
-def extract_external_links(page: Page) -> List[str]:
+def extract_external_links(page: Page, ctx: Optional[PageCtx] = None) -> List[str]:
     """
     Extract all external links (excluding internal navigation).
     
     External links are those pointing to different domains.
+    
+    Args:
+        page: Playwright page
+        ctx: Page state already fetched by the caller (fetched if omitted)
     """
     try:
-        current_domain = re.search(r'https?://([^/]+)', page.url).group(1)
-        
-        # Get all links
-        all_links = page.locator('a[href]').all()
-        external_links = []
-        
-        for link in all_links:
-            href = link.get_attribute('href')
-            if href and href.startswith('http'):
-                link_domain = re.search(r'https?://([^/]+)', href)
-                if link_domain and link_domain.group(1) != current_domain:
-                    external_links.append(href)
-        
-        return list(set(external_links))
+        if ctx is None:
+            ctx = read_page_ctx(page)
+        current_domain = urlsplit(ctx.url).netloc
+        
+        external_links = set()
+        for href in ctx.links:
+            if href.startswith('http'):
+                link_domain = urlsplit(href).netloc
+                if link_domain and link_domain != current_domain:
+                    external_links.add(href)
+        
+        return list(external_links)
     except:
         return []
 
 
-def extract_descriptions(page: Page) -> str:
+def extract_descriptions(page: Page, ctx: Optional[PageCtx] = None) -> str:
     """
     Extract visible description text from page body.
     
-    Looks for common description patterns and about sections.
+    Looks for common description patterns and about sections. The
+    selectors are tried in the browser as part of the EXTRACT_JS snapshot,
+    so this costs no round-trips of its own.
+    
+    Args:
+        page: Playwright page
+        ctx: Page state already fetched by the caller (fetched if omitted)
     """
     try:
-        # Try to find description in common locations
-        selectors = [
-            '.description',
-            '#description',
-            '.about',
-            '#about',
-            '[class*="description"]',
-            '[class*="about"]',
-            'p',  # Fallback to first few paragraphs
-        ]
-        
-        for selector in selectors:
-            elements = page.locator(selector).all()
-            if elements:
-                texts = [el.inner_text() for el in elements[:3]]  # Get first 3 matches
-                combined = ' '.join(texts).strip()
-                if len(combined) > 50:  # Only return if substantial
-                    return combined[:500]  # Limit to 500 chars
-        
-        return ""
+        if ctx is None:
+            ctx = read_page_ctx(page)
+        return ctx.dom.get('description') or ""
     except:
         return ""
 
 
-def extract_messaging_links(page: Page) -> Dict[str, str]:
+def extract_messaging_links(page: Page, extractions: Optional[PageExtractions] = None) -> Dict[str, str]:
     """
     Extract messaging app links (WhatsApp, Telegram, Signal, Discord).
     
+    Args:
+        page: Playwright page (only read when extractions is not supplied)
+        extractions: Pre-computed scan_page() result for this page
+    
     Returns:
         Dictionary with messaging platform links
     """
     try:
-        content = page.content()
-        messaging = {
-            'whatsapp': '',
-            'telegram': '',
-            'signal': '',
-            'discord': ''
+        if extractions is None:
+            extractions = scan_page(read_page_ctx(page).raw)
+        
+        return {
+            'whatsapp': extractions.messaging.get('whatsapp', ''),
+            'telegram': extractions.messaging.get('telegram', ''),
+            'signal': extractions.messaging.get('signal', ''),
+            'discord': extractions.messaging.get('discord', '')
         }
-        
-        # WhatsApp patterns
-        whatsapp_pattern = r'https?://(?:wa\.me|api\.whatsapp\.com|chat\.whatsapp\.com)/[^\s"\'>]+'
-        whatsapp_matches = re.findall(whatsapp_pattern, content)
-        messaging['whatsapp'] = whatsapp_matches[0] if whatsapp_matches else ""
-        
-        # Telegram patterns
-        telegram_pattern = r'https?://(?:t\.me|telegram\.me|telegram\.org)/[^\s"\'>]+'
-        telegram_matches = re.findall(telegram_pattern, content)
-        messaging['telegram'] = telegram_matches[0] if telegram_matches else ""
-        
-        # Signal patterns
-        signal_pattern = r'https?://signal\.(?:group|me)/[^\s"\'>]+'
-        signal_matches = re.findall(signal_pattern, content)
-        messaging['signal'] = signal_matches[0] if signal_matches else ""
-        
-        # Discord patterns
-        discord_pattern = r'https?://(?:discord\.gg|discord\.com/invite)/[^\s"\'>]+'
-        discord_matches = re.findall(discord_pattern, content)
-        messaging['discord'] = discord_matches[0] if discord_matches else ""
-        
-        return messaging
     except:
         return {'whatsapp': '', 'telegram': '', 'signal': '', 'discord': ''}
 
@@ -954,140 +1148,253 @@ def extract_messaging_links(page: Page) -> Dict[str, str]:
 # BUSINESS INTELLIGENCE INFERENCE
 # ============================================================================
 
-def infer_industry(page: Page) -> str:
+# Industry keyword mappings
+INDUSTRY_KEYWORDS = {
+    'Technology': ['software', 'tech', 'app', 'digital', 'cloud', 'saas', 'api', 'developer'],
+    'E-commerce': ['shop', 'store', 'buy', 'cart', 'checkout', 'product', 'price', 'shipping'],
+    'Healthcare': ['health', 'medical', 'doctor', 'clinic', 'hospital', 'patient', 'care', 'wellness'],
+    'Finance': ['bank', 'finance', 'investment', 'loan', 'credit', 'insurance', 'trading'],
+    'Education': ['education', 'school', 'university', 'course', 'learning', 'student', 'teacher'],
+    'Real Estate': ['property', 'real estate', 'house', 'apartment', 'rent', 'buy', 'listing'],
+    'Food & Restaurant': ['restaurant', 'food', 'menu', 'dining', 'cafe', 'delivery', 'cuisine'],
+    'Marketing': ['marketing', 'advertising', 'seo', 'social media', 'branding', 'campaign'],
+    'Legal': ['law', 'legal', 'attorney', 'lawyer', 'court', 'litigation'],
+    'Consulting': ['consulting', 'consultant', 'advisory', 'strategy', 'business'],
+}
+
+BLOG_KEYWORDS = ['blog', 'article', 'post', 'news']
+
+PRODUCT_SERVICE_KEYWORDS = [
+    'product', 'service', 'offer', 'solution', 'package',
+    'pricing', 'price', 'buy', 'purchase', 'order',
+    'features', 'plans', 'subscription'
+]
+
+# Keyword -> industries it scores for (e.g. 'buy' counts for two)
+_KEYWORD_INDUSTRIES: Dict[str, List[str]] = {}
+for _industry, _keywords in INDUSTRY_KEYWORDS.items():
+    for _keyword in _keywords:
+        _KEYWORD_INDUSTRIES.setdefault(_keyword, []).append(_industry)
+
+_BLOG_KEYWORD_SET = frozenset(BLOG_KEYWORDS)
+_PRODUCT_SERVICE_KEYWORD_SET = frozenset(PRODUCT_SERVICE_KEYWORDS)
+
+# Every keyword once, in a stable order
+_ALL_KEYWORDS = list(dict.fromkeys(BLOG_KEYWORDS + PRODUCT_SERVICE_KEYWORDS + list(_KEYWORD_INDUSTRIES)))
+
+# (keyword, UTF-8 bytes) pairs for the bytes search fallback; keywords are
+# ASCII, so a bytes match is exactly a str match
+_ALL_KEYWORDS_BYTES = [(keyword, keyword.encode()) for keyword in _ALL_KEYWORDS]
+
+if AHOCORASICK_AVAILABLE:
+    # One automaton over every keyword, so a single pass finds them all
+    _keyword_automaton = ahocorasick.Automaton()
+    for _keyword in _ALL_KEYWORDS:
+        _keyword_automaton.add_word(_keyword, _keyword)
+    _keyword_automaton.make_automaton()
+
+
+def _industry_decided(scores: Dict[str, int], remaining: Dict[str, int]) -> bool:
+    """True once no other industry can catch the current leader, even with every unseen keyword"""
+    leader = max(scores, key=scores.get)
+    lead = scores[leader]
+    return lead > 0 and all(
+        scores[industry] + remaining[industry] < lead
+        for industry in scores if industry != leader
+    )
+
+
+def classify_content(content_lower: str) -> ContentSignals:
+    """
+    Run the industry, blog and product/service keyword checks together.
+    
+    With pyahocorasick installed every keyword is found in one linear pass
+    over the HTML; otherwise each keyword is checked with a substring test.
+    Either way the scan stops early once blog and product keywords have
+    been seen and the leading industry can no longer be overtaken.
+    
+    Args:
+        content_lower: Lowercased page HTML
+        
+    Returns:
+        ContentSignals for the page
+    """
+    if AHOCORASICK_AVAILABLE:
+        hits = (keyword for _, keyword in _keyword_automaton.iter(content_lower))
+    elif content_lower.isascii():
+        hits = (keyword for keyword in _ALL_KEYWORDS if keyword in content_lower)
+    else:
+        # Non-ASCII text is stored at 2-4 bytes per character; searching its
+        # UTF-8 encoding (encoded once) walks fewer bytes per keyword
+        content_bytes = content_lower.encode('utf-8', 'ignore')
+        hits = (keyword for keyword, keyword_bytes in _ALL_KEYWORDS_BYTES if keyword_bytes in content_bytes)
+    
+    signals = ContentSignals()
+    found = set()
+    
+    # Count keyword matches for each industry, tracking how many are still unseen
+    scores = dict.fromkeys(INDUSTRY_KEYWORDS, 0)
+    remaining = {industry: len(keywords) for industry, keywords in INDUSTRY_KEYWORDS.items()}
+    
+    for keyword in hits:
+        if keyword in found:
+            continue
+        found.add(keyword)
+        
+        if keyword in _BLOG_KEYWORD_SET:
+            signals.blog_keywords = True
+        if keyword in _PRODUCT_SERVICE_KEYWORD_SET:
+            signals.products_or_services = True
+        
+        industries = _KEYWORD_INDUSTRIES.get(keyword)
+        if industries:
+            for industry in industries:
+                scores[industry] += 1
+                remaining[industry] -= 1
+            
+            # Branch and bound: nothing left to learn from the rest of the page
+            if signals.blog_keywords and signals.products_or_services and _industry_decided(scores, remaining):
+                break
+    
+    # Industry with highest score
+    if any(scores.values()):
+        signals.industry = max(scores, key=scores.get)
+    
+    return signals
+
+
+def infer_industry(page: Page, ctx: Optional[PageCtx] = None,
+                   signals: Optional[ContentSignals] = None) -> str:
     """
     Infer industry/category using keyword analysis.
     
     Analyzes page content for industry-specific keywords.
+    
+    Args:
+        page: Playwright page
+        ctx: Page state already fetched by the caller (fetched if omitted)
+        signals: Result of classify_content() already computed by the caller
     """
     try:
-        content = page.content().lower()
-        
-        # Industry keyword mappings
-        industries = {
-            'Technology': ['software', 'tech', 'app', 'digital', 'cloud', 'saas', 'api', 'developer'],
-            'E-commerce': ['shop', 'store', 'buy', 'cart', 'checkout', 'product', 'price', 'shipping'],
-            'Healthcare': ['health', 'medical', 'doctor', 'clinic', 'hospital', 'patient', 'care', 'wellness'],
-            'Finance': ['bank', 'finance', 'investment', 'loan', 'credit', 'insurance', 'trading'],
-            'Education': ['education', 'school', 'university', 'course', 'learning', 'student', 'teacher'],
-            'Real Estate': ['property', 'real estate', 'house', 'apartment', 'rent', 'buy', 'listing'],
-            'Food & Restaurant': ['restaurant', 'food', 'menu', 'dining', 'cafe', 'delivery', 'cuisine'],
-            'Marketing': ['marketing', 'advertising', 'seo', 'social media', 'branding', 'campaign'],
-            'Legal': ['law', 'legal', 'attorney', 'lawyer', 'court', 'litigation'],
-            'Consulting': ['consulting', 'consultant', 'advisory', 'strategy', 'business'],
-        }
-        
-        # Count keyword matches for each industry
-        scores = {}
-        for industry, keywords in industries.items():
-            score = sum(1 for keyword in keywords if keyword in content)
-            if score > 0:
-                scores[industry] = score
-        
-        # Return industry with highest score
-        if scores:
-            return max(scores, key=scores.get)
-        
-        return "General"
+        if signals is None:
+            signals = classify_content((ctx or read_page_ctx(page)).lower)
+        return signals.industry
     except:
         return "Unknown"
 
 
-def detect_contact_form(page: Page) -> bool:
+def detect_contact_form(page: Page, ctx: Optional[PageCtx] = None) -> bool:
     """
     Detect presence of contact forms.
     
     Checks for form elements on the page.
+    
+    Args:
+        page: Playwright page
+        ctx: Page state already fetched by the caller (fetched if omitted)
     """
     try:
-        # Look for forms
-        forms = page.locator('form').count()
-        if forms > 0:
-            return True
-        
-        # Look for common contact form indicators
-        contact_indicators = [
-            'input[type="email"]',
-            'textarea',
-            'input[name*="message"]',
-            'input[name*="contact"]',
-        ]
-        
-        for indicator in contact_indicators:
-            if page.locator(indicator).count() > 0:
-                return True
+        if ctx is None:
+            ctx = read_page_ctx(page)
         
-        return False
+        # Forms or common contact form indicators (checked in the browser snapshot)
+        return bool(ctx.dom.get('has_contact_form'))
     except:
         return False
 
 
-def calculate_word_count(page: Page) -> int:
+_WORD_PATTERN = re.compile(r'\S+')
+
+
+def calculate_word_count(page: Page, ctx: Optional[PageCtx] = None) -> int:
     """
     Calculate estimated word count of visible content.
     
     Counts words in the visible text of the page body.
+    
+    Args:
+        page: Playwright page
+        ctx: Page state already fetched by the caller (fetched if omitted)
     """
     try:
         # Get visible text from body
-        body_text = page.locator('body').inner_text()
+        if ctx is None:
+            ctx = read_page_ctx(page)
         
-        # Split by whitespace and count
-        words = body_text.split()
-        return len(words)
+        # Count whitespace-separated runs without building a list of words
+        return sum(1 for _ in _WORD_PATTERN.finditer(ctx.body_text))
     except:
         return 0
 
 
-def detect_blog(page: Page) -> bool:
+def detect_all(page: Page, ctx: Optional[PageCtx] = None,
+               signals: Optional[ContentSignals] = None) -> Tuple[bool, bool]:
     """
-    Detect if blog section exists.
+    Run the blog and product/service detectors together.
     
-    Looks for blog indicators in URLs, links, and content.
+    Cheap checks go first and each detector stops at its first hit: the
+    URL can settle the blog question before any content is looked at, and
+    the link scan only runs when neither the URL nor the content did.
+    
+    Args:
+        page: Playwright page
+        ctx: Page state already fetched by the caller (fetched if omitted)
+        signals: Result of classify_content() already computed by the caller
+    
+    Returns:
+        Tuple of (blog_present, products_or_services)
     """
     try:
-        content = page.content().lower()
-        url = page.url.lower()
-        
-        # Check URL for blog indicators
-        if 'blog' in url or 'news' in url or 'article' in url:
-            return True
+        if ctx is None:
+            ctx = read_page_ctx(page)
+        url = ctx.url_lower
+        
+        # Check URL and content for blog indicators
+        blog = 'blog' in url or 'news' in url or 'article' in url
+        if signals is not None:
+            blog = blog or signals.blog_keywords
+            products = signals.products_or_services
+        else:
+            blog = blog or any(keyword in ctx.lower for keyword in BLOG_KEYWORDS)
+            products = any(keyword in ctx.lower for keyword in PRODUCT_SERVICE_KEYWORDS)
         
         # Check for blog-related links
-        blog_links = page.locator('a[href*="blog"], a[href*="news"], a[href*="article"]').count()
-        if blog_links > 0:
-            return True
+        if not blog:
+            blog = any('blog' in href or 'news' in href or 'article' in href for href in ctx.links)
         
-        # Check content for blog indicators
-        blog_keywords = ['blog', 'article', 'post', 'news']
-        if any(keyword in content for keyword in blog_keywords):
-            return True
-        
-        return False
+        return blog, products
     except:
-        return False
+        return False, False
+
+
+def detect_blog(page: Page, ctx: Optional[PageCtx] = None,
+                signals: Optional[ContentSignals] = None) -> bool:
+    """
+    Detect if blog section exists.
+    
+    Looks for blog indicators in URLs, links, and content.
+    
+    Args:
+        page: Playwright page
+        ctx: Page state already fetched by the caller (fetched if omitted)
+        signals: Result of classify_content() already computed by the caller
+    """
+    return detect_all(page, ctx, signals)[0]
 
 
-def detect_products_services(page: Page) -> bool:
+def detect_products_services(page: Page, ctx: Optional[PageCtx] = None,
+                             signals: Optional[ContentSignals] = None) -> bool:
     """
     Detect if products or services are mentioned.
     
     Looks for product/service keywords in content.
+    
+    Args:
+        page: Playwright page
+        ctx: Page state already fetched by the caller (fetched if omitted)
+        signals: Result of classify_content() already computed by the caller
     """
-    try:
-        content = page.content().lower()
-        
-        # Product/service keywords
-        keywords = [
-            'product', 'service', 'offer', 'solution', 'package',
-            'pricing', 'price', 'buy', 'purchase', 'order',
-            'features', 'plans', 'subscription'
-        ]
-        
-        # Check if any keywords present
-        return any(keyword in content for keyword in keywords)
-    except:
-        return False
+    return detect_all(page, ctx, signals)[1]
 
 
 # ============================================================================
@@ -1105,9 +1412,15 @@ def clean_text(text: Union[str, List[str]]) -> Union[str, List[str]]:
         Cleaned string or list with duplicates removed
     """
     if isinstance(text, list):
-        # Clean each item and remove duplicates
-        cleaned = [item.strip() for item in text if item and item.strip()]
-        return list(dict.fromkeys(cleaned))  # Preserve order while removing duplicates
+        # Clean each item and remove duplicates, preserving order
+        seen = set()
+        cleaned = []
+        for item in text:
+            item = item.strip() if item else item
+            if item and item not in seen:
+                seen.add(item)
+                cleaned.append(item)
+        return cleaned
     elif isinstance(text, str):
         return text.strip()
     return text
@@ -1128,10 +1441,12 @@ def normalize_data(data: Union[str, List[str]]) -> Union[str, List[str]]:
         Normalized data
     """
     if isinstance(data, list):
+        seen = set()
         normalized = []
         for item in data:
             item = item.strip().lower()
-            if item and item not in normalized:
+            if item and item not in seen:
+                seen.add(item)
                 normalized.append(item)
         return normalized
     elif isinstance(data, str):
@@ -1188,12 +1503,46 @@ def generate_csv_filename() -> str:
     return f"scrape_{timestamp}.csv"
 
 
+# Column order with all new fields
+CSV_FIELDNAMES = [
+    'url', 'title', 'emails', 'phones', 'social_links', 'external_links',
+    'description', 'meta_description', 'og_title', 'og_description', 'og_image',
+    'address',  # Simplified: single address field
+    'whatsapp', 'telegram', 'signal', 'discord',
+    'contact_form', 'industry', 'blog_present', 'products_or_services',
+    'word_count', 'scrape_timestamp',
+    'email_count', 'phone_count', 'social_count'
+]
+
+_CSV_BUFFER_SIZE = 1024 * 1024
+
+# Open append handles reused across save_to_csv() calls: filename -> (file, writer)
+_csv_handles: Dict[str, Tuple] = {}
+
+
+# Reads every column off a ScrapedData in CSV order with one C-level call
+_CSV_ROW_GETTER = operator.attrgetter(*CSV_FIELDNAMES)
+
+# Positions of the multi-value columns that need joining
+_CSV_LIST_COLUMNS = [CSV_FIELDNAMES.index(name) for name in ('emails', 'phones', 'social_links', 'external_links')]
+
+
+def _csv_row(data: ScrapedData) -> List:
+    """Convert ScrapedData to a positional CSV row with list fields formatted"""
+    row = list(_CSV_ROW_GETTER(data))
+    for column in _CSV_LIST_COLUMNS:
+        row[column] = format_list_field(row[column])
+    return row
+
+
 def save_to_csv(data: ScrapedData, filename: str = None):
     """
     Save extracted data to CSV file.
     
     Creates file with headers if it doesn't exist, otherwise appends.
     Properly escapes special characters and handles multi-value fields.
+    The file is opened once and kept open (buffered) for later rows;
+    call close_csv() when done (also done automatically at exit).
     
     Args:
         data: ScrapedData object to save
@@ -1205,37 +1554,23 @@ def save_to_csv(data: ScrapedData, filename: str = None):
         
         print(f"[*] Saving data to {filename}...")
         
-        # Define column order with all new fields
-        fieldnames = [
-            'url', 'title', 'emails', 'phones', 'social_links', 'external_links',
-            'description', 'meta_description', 'og_title', 'og_description', 'og_image',
-            'address',  # Simplified: single address field
-            'whatsapp', 'telegram', 'signal', 'discord',
-            'contact_form', 'industry', 'blog_present', 'products_or_services',
-            'word_count', 'scrape_timestamp',
-            'email_count', 'phone_count', 'social_count'
-        ]
-        
-        # Check if file exists
-        file_exists = Path(filename).exists()
-        
-        # Open file in append mode
-        with open(filename, 'a', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        handle = _csv_handles.get(filename)
+        if handle is None:
+            # Check if file exists
+            file_exists = Path(filename).exists()
+            
+            # Open file in append mode
+            csvfile = open(filename, 'a', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE)
+            writer = csv.writer(csvfile)
             
             # Write header if new file
             if not file_exists:
-                writer.writeheader()
-            
-            # Convert data to dict and format list fields
-            row = asdict(data)
-            row['emails'] = format_list_field(row['emails'])
-            row['phones'] = format_list_field(row['phones'])
-            row['social_links'] = format_list_field(row['social_links'])
-            row['external_links'] = format_list_field(row['external_links'])
+                writer.writerow(CSV_FIELDNAMES)
             
-            # Write row
-            writer.writerow(row)
+            handle = _csv_handles[filename] = (csvfile, writer)
+        
+        # Write row
+        handle[1].writerow(_csv_row(data))
         
         print(f"[+] Data saved successfully to {filename}")
         return filename
@@ -1245,10 +1580,39 @@ def save_to_csv(data: ScrapedData, filename: str = None):
         return None
 
 
+def close_csv(filename: str = None):
+    """
+    Flush and close CSV files held open by save_to_csv().
+    
+    Args:
+        filename: File to close (if None, closes all of them)
+    """
+    filenames = [filename] if filename is not None else list(_csv_handles)
+    for name in filenames:
+        handle = _csv_handles.pop(name, None)
+        if handle:
+            handle[0].close()
+
+
+atexit.register(close_csv)
+
+
 # ============================================================================
 # URL VALIDATION AND USER INPUT
 # ============================================================================
 
+# URL regex pattern: protocol + domain + optional path (compiled once at import)
+_URL_PATTERN = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
+    r'localhost|'  # localhost
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # or IP
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$',  # optional path
+    re.IGNORECASE
+)
+
+
 def validate_url(url: str) -> bool:
     """
     Validate URL format using regex.
@@ -1267,18 +1631,7 @@ def validate_url(url: str) -> bool:
         >>> validate_url("not-a-url")
         False
     """
-    # URL regex pattern: protocol + domain + optional path
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
-        r'localhost|'  # localhost
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # or IP
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$',  # optional path
-        re.IGNORECASE
-    )
-    
-    return bool(url_pattern.match(url.strip()))
+    return _URL_PATTERN.match(url.strip()) is not None
 
 
 def get_user_input() -> List[str]:
@@ -1314,6 +1667,32 @@ def get_user_input() -> List[str]:
             return urls
 
 
+def interleave_by_host(urls: List[str]) -> List[str]:
+    """
+    Reorder URLs round-robin by host so concurrent workers spread load.
+    
+    A list grouped by domain would otherwise send every worker to the same
+    host at once. Relative order within each host is preserved.
+    
+    Args:
+        urls: URLs in input order
+        
+    Returns:
+        The same URLs, alternating between hosts
+    """
+    by_host: Dict[str, List[str]] = {}
+    for url in urls:
+        by_host.setdefault(urlsplit(url).netloc.lower(), []).append(url)
+    
+    interleaved = []
+    queues = list(by_host.values())
+    for position in range(max((len(q) for q in queues), default=0)):
+        for queue in queues:
+            if position < len(queue):
+                interleaved.append(queue[position])
+    return interleaved
+
+
 # ============================================================================
 # TERMINAL OUTPUT AND DISPLAY
 # ============================================================================
@@ -1327,12 +1706,6 @@ def display_summary(data: ScrapedData):
     Args:
         data: ScrapedData object to display
     """
-    print()
-    print("=" * 60)
-    print("EXTRACTION SUMMARY")
-    print("=" * 60)
-    print()
-    
     # Helper function to format display
     def format_value(value):
         if value == "NONE" or not value or (isinstance(value, list) and len(value) == 0):
@@ -1347,40 +1720,49 @@ def display_summary(data: ScrapedData):
             # Truncate long strings
             return value[:100] + "..." if len(str(value)) > 100 else str(value)
     
-    # Display each field
-    print(f"URL:              {data.url}")
-    print(f"Title:            {format_value(data.title)}")
-    print()
-    print("CONTACT INFORMATION:")
-    print(f"  Emails:         {format_value(data.emails)} ({data.email_count} found)")
-    print(f"  Phones:         {format_value(data.phones)} ({data.phone_count} found)")
-    print(f"  Address:        {format_value(data.address)}")
-    print()
-    print("MESSAGING APPS:")
-    print(f"  WhatsApp:       {format_value(data.whatsapp)}")
-    print(f"  Telegram:       {format_value(data.telegram)}")
-    print(f"  Signal:         {format_value(data.signal)}")
-    print(f"  Discord:        {format_value(data.discord)}")
-    print()
-    print("SOCIAL MEDIA:")
-    print(f"  Links:          {format_value(data.social_links)} ({data.social_count} found)")
-    print()
-    print("WEBSITE DATA:")
-    print(f"  Description:    {format_value(data.description)}")
-    print(f"  Meta Desc:      {format_value(data.meta_description)}")
-    print(f"  OG Title:       {format_value(data.og_title)}")
-    print(f"  External Links: {format_value(data.external_links)}")
-    print(f"  Word Count:     {format_value(data.word_count)}")
-    print()
-    print("BUSINESS INTELLIGENCE:")
-    print(f"  Industry:       {format_value(data.industry)}")
-    print(f"  Contact Form:   {format_value(data.contact_form)}")
-    print(f"  Blog Present:   {format_value(data.blog_present)}")
-    print(f"  Products/Svcs:  {format_value(data.products_or_services)}")
-    print()
-    print(f"Timestamp:        {data.scrape_timestamp}")
-    print()
-    print("=" * 60)
+    # Build each field into one buffer, then write it in a single call so
+    # the summary isn't interleaved with other workers' progress output
+    lines = [
+        "",
+        "=" * 60,
+        "EXTRACTION SUMMARY",
+        "=" * 60,
+        "",
+        f"URL:              {data.url}",
+        f"Title:            {format_value(data.title)}",
+        "",
+        "CONTACT INFORMATION:",
+        f"  Emails:         {format_value(data.emails)} ({data.email_count} found)",
+        f"  Phones:         {format_value(data.phones)} ({data.phone_count} found)",
+        f"  Address:        {format_value(data.address)}",
+        "",
+        "MESSAGING APPS:",
+        f"  WhatsApp:       {format_value(data.whatsapp)}",
+        f"  Telegram:       {format_value(data.telegram)}",
+        f"  Signal:         {format_value(data.signal)}",
+        f"  Discord:        {format_value(data.discord)}",
+        "",
+        "SOCIAL MEDIA:",
+        f"  Links:          {format_value(data.social_links)} ({data.social_count} found)",
+        "",
+        "WEBSITE DATA:",
+        f"  Description:    {format_value(data.description)}",
+        f"  Meta Desc:      {format_value(data.meta_description)}",
+        f"  OG Title:       {format_value(data.og_title)}",
+        f"  External Links: {format_value(data.external_links)}",
+        f"  Word Count:     {format_value(data.word_count)}",
+        "",
+        "BUSINESS INTELLIGENCE:",
+        f"  Industry:       {format_value(data.industry)}",
+        f"  Contact Form:   {format_value(data.contact_form)}",
+        f"  Blog Present:   {format_value(data.blog_present)}",
+        f"  Products/Svcs:  {format_value(data.products_or_services)}",
+        "",
+        f"Timestamp:        {data.scrape_timestamp}",
+        "",
+        "=" * 60,
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def display_error(message: str):
@@ -1411,135 +1793,386 @@ def display_success():
 # MAIN ENTRY POINT
 # ============================================================================
 
-def scrape_single_url(url: str, browser_manager: BrowserManager, csv_filename: str, add_delay: bool = False) -> Optional[ScrapedData]:
+def extract_page_data(page: Page) -> ScrapedData:
+    """
+    Run every extractor against an already-loaded page.
+    
+    Everything the extractors read (visible text, links, meta tags,
+    JSON-LD, address itemprops) is fetched from the browser in a single
+    evaluate and handed to them, instead of every extractor round-tripping
+    to Chromium for its own copy.
+    
+    Args:
+        page: Loaded (and scrolled) Playwright page
+        
+    Returns:
+        Cleaned ScrapedData for the page
+    """
+    # Fetch page state once
+    ctx = read_page_ctx(page)
+    
+    # Extract all data fields
+    extracted_url = ctx.url
+    title = extract_title(page, ctx)
+    metadata = extract_metadata(page, ctx.dom, include_json_ld=False)  # JSON-LD isn't exported
+    extractions = scan_page(ctx.raw)  # One text pass for all pattern-based fields
+    emails = extract_emails(page, extractions)
+    phones = extract_phones(page, extractions)
+    address_data = extract_address(page, ctx.raw, ctx.dom)
+    social_links = extract_social_links(page, extractions)
+    external_links = extract_external_links(page, ctx)
+    description = extract_descriptions(page, ctx)
+    messaging = extract_messaging_links(page, extractions)
+    
+    # Business intelligence
+    signals = classify_content(ctx.lower)  # One keyword pass for all classifiers
+    industry = infer_industry(page, ctx, signals)
+    contact_form = detect_contact_form(page, ctx)
+    word_count = calculate_word_count(page, ctx)
+    blog_present, products_or_services = detect_all(page, ctx, signals)
+    
+    # Timestamp
+    timestamp = generate_timestamp()
+    
+    # Clean and normalize data (normalize_data already strips and dedups in its single pass)
+    emails = normalize_data(emails)
+    phones = clean_text(phones)
+    social_links = normalize_data(social_links)
+    external_links = normalize_data(external_links)
+    
+    # Apply defaults
+    emails, phones = apply_defaults(emails, phones)
+    
+    # Calculate metrics
+    email_count = len(emails) if isinstance(emails, list) else 0
+    phone_count = len(phones) if isinstance(phones, list) else 0
+    social_count = len(social_links) if isinstance(social_links, list) else 0
+    
+    # Format address: use full address with country if available
+    address_str = address_data.get('full', '')
+    if not address_str and address_data.get('country'):
+        # If no full address but have country, just use country
+        address_str = address_data.get('country', '')
+    
+    return ScrapedData(
+        url=extracted_url,
+        title=title,
+        emails=emails,
+        phones=phones,
+        social_links=social_links,
+        external_links=external_links,
+        description=description,
+        meta_description=metadata.get('meta_description', ''),
+        og_title=metadata.get('og_title', ''),
+        og_description=metadata.get('og_description', ''),
+        og_image=metadata.get('og_image', ''),
+        address=address_str,  # Single address field
+        whatsapp=messaging.get('whatsapp', ''),
+        telegram=messaging.get('telegram', ''),
+        signal=messaging.get('signal', ''),
+        discord=messaging.get('discord', ''),
+        contact_form=contact_form,
+        industry=industry,
+        blog_present=blog_present,
+        products_or_services=products_or_services,
+        word_count=word_count,
+        scrape_timestamp=timestamp,
+        email_count=email_count,
+        phone_count=phone_count,
+        social_count=social_count
+    )
+
+
+def fetch_page_data(url: str, browser_manager: BrowserManager, add_delay: bool = False) -> Optional[ScrapedData]:
     """
-    Scrape a single URL and return the data.
+    Load, scroll and extract a single URL with the given browser.
+    
+    Does not save or display anything, so it is safe to run from a worker
+    thread while other URLs are in flight.
     
     Args:
         url: URL to scrape
-        browser_manager: BrowserManager instance
-        csv_filename: CSV file to save results to
+        browser_manager: BrowserManager instance owned by the calling thread
         add_delay: Whether to add random delay before scraping (for anti-detection)
         
     Returns:
         ScrapedData object or None if failed
     """
     try:
-        print()
-        print("-" * 60)
-        print(f"[*] Processing: {url}")
-        print("-" * 60)
+        log_progress(f"[*] Processing: {url}")
         
         # Add random delay for anti-detection (human-like behavior)
         if add_delay:
-            import random
             delay = random.uniform(2, 5)  # Random delay between 2-5 seconds
-            print(f"[*] Waiting {delay:.1f}s (anti-detection)...")
+            log_progress(f"[*] Waiting {delay:.1f}s (anti-detection)...")
             time.sleep(delay)
         
         # Load page
-        print("[*] Loading page...")
+        log_progress("[*] Loading page...")
         if not browser_manager.load_page(url):
-            print(f"[X] Failed to load {url}")
+            log_progress(f"[X] Failed to load {url}")
             return None
         
         # Scroll page
-        print("[*] Scrolling to load dynamic content...")
+        log_progress("[*] Scrolling to load dynamic content...")
         browser_manager.scroll_to_bottom()
         
         # Extract data
-        print("[*] Extracting data...")
-        page = browser_manager.page
-        
-        # Extract all data fields
-        extracted_url = extract_url(page)
-        title = extract_title(page)
-        metadata = extract_metadata(page)
-        emails = extract_emails(page)
-        phones = extract_phones(page)
-        address_data = extract_address(page)
-        social_links = extract_social_links(page)
-        external_links = extract_external_links(page)
-        description = extract_descriptions(page)
-        messaging = extract_messaging_links(page)
-        
-        # Business intelligence
-        industry = infer_industry(page)
-        contact_form = detect_contact_form(page)
-        word_count = calculate_word_count(page)
-        blog_present = detect_blog(page)
-        products_or_services = detect_products_services(page)
-        
-        # Timestamp
-        timestamp = generate_timestamp()
-        
-        print("[+] Data extraction complete")
-        
-        # Clean and normalize data
-        print("[*] Cleaning and normalizing data...")
-        emails = clean_text(normalize_data(emails))
-        phones = clean_text(phones)
-        social_links = clean_text(normalize_data(social_links))
-        external_links = clean_text(normalize_data(external_links))
-        
-        # Apply defaults
-        emails, phones = apply_defaults(emails, phones)
-        
-        # Calculate metrics
-        email_count = len(emails) if isinstance(emails, list) else 0
-        phone_count = len(phones) if isinstance(phones, list) else 0
-        social_count = len(social_links) if isinstance(social_links, list) else 0
-        
-        print("[+] Data cleaned")
-        print(f"[*] Metrics: {email_count} emails, {phone_count} phones, {social_count} social links")
-        
-        # Create ScrapedData object
-        # Format address: use full address with country if available
-        address_str = address_data.get('full', '')
-        if not address_str and address_data.get('country'):
-            # If no full address but have country, just use country
-            address_str = address_data.get('country', '')
-        
-        scraped_data = ScrapedData(
-            url=extracted_url,
-            title=title,
-            emails=emails,
-            phones=phones,
-            social_links=social_links,
-            external_links=external_links,
-            description=description,
-            meta_description=metadata.get('meta_description', ''),
-            og_title=metadata.get('og_title', ''),
-            og_description=metadata.get('og_description', ''),
-            og_image=metadata.get('og_image', ''),
-            address=address_str,  # Single address field
-            whatsapp=messaging.get('whatsapp', ''),
-            telegram=messaging.get('telegram', ''),
-            signal=messaging.get('signal', ''),
-            discord=messaging.get('discord', ''),
-            contact_form=contact_form,
-            industry=industry,
-            blog_present=blog_present,
-            products_or_services=products_or_services,
-            word_count=word_count,
-            scrape_timestamp=timestamp,
-            email_count=email_count,
-            phone_count=phone_count,
-            social_count=social_count
-        )
+        log_progress("[*] Extracting data...")
+        scraped_data = extract_page_data(browser_manager.page)
+        
+        log_progress("[+] Data extraction complete")
+        log_progress(f"[*] Metrics: {scraped_data.email_count} emails, {scraped_data.phone_count} phones, {scraped_data.social_count} social links")
+        
+        return scraped_data
         
+    except Exception as e:
+        log_progress(f"[X] Error scraping {url}: {str(e)}")
+        return None
+
+
+def scrape_single_url(url: str, browser_manager: BrowserManager, csv_filename: str, add_delay: bool = False) -> Optional[ScrapedData]:
+    """
+    Scrape a single URL, save it to CSV and display the summary.
+    
+    Args:
+        url: URL to scrape
+        browser_manager: BrowserManager instance
+        csv_filename: CSV file to save results to
+        add_delay: Whether to add random delay before scraping (for anti-detection)
+        
+    Returns:
+        ScrapedData object or None if failed
+    """
+    print()
+    print("-" * 60)
+    scraped_data = fetch_page_data(url, browser_manager, add_delay)
+    print("-" * 60)
+    
+    if scraped_data:
         # Save to CSV
         print("[*] Saving to CSV...")
         save_to_csv(scraped_data, csv_filename)
         
         # Display summary
         display_summary(scraped_data)
+    
+    return scraped_data
+
+
+class BrowserSlot:
+    """
+    One warm browser pinned to its own worker thread.
+    
+    Playwright's sync API objects must be used from the thread that created
+    them, so each slot owns a single-thread executor and launches its browser
+    lazily on that thread. The browser is reused across URLs; a proxy
+    rotation only swaps its context.
+    
+    Slots sharing a proxy pool each hold a different proxy while there are
+    enough to go round, so concurrent pages go out through different IPs.
+    """
+    
+    def __init__(self, proxy_pool: Optional[deque] = None):
+        """
+        Args:
+            proxy_pool: Shared queue of proxies not currently held by any slot
+        """
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.browser_manager: Optional[BrowserManager] = None
+        self.uses = 0
+        self.proxy_pool = proxy_pool
+    
+    def take_proxy(self, current: Optional[ProxyConfig] = None) -> Optional[ProxyConfig]:
+        """
+        Take an idle proxy from the pool, handing the current one back.
         
-        return scraped_data
+        Falls back to the global rotation once every proxy is held by a slot.
         
-    except Exception as e:
-        print(f"[X] Error scraping {url}: {str(e)}")
-        return None
+        Args:
+            current: Proxy this slot is giving up, if any
+            
+        Returns:
+            ProxyConfig object or None if no proxies available
+        """
+        with _proxy_lock:
+            if self.proxy_pool:
+                proxy = self.proxy_pool.popleft()
+                if current is not None:
+                    self.proxy_pool.append(current)
+                return proxy
+        return get_next_proxy(force_rotate=current is not None)
+    
+    def scrape(self, url: str, add_delay: bool) -> Optional[ScrapedData]:
+        """
+        Scrape a URL on this slot's browser (runs on the slot thread).
+        
+        Progress lines for the URL are buffered and written as one block
+        when it finishes, so output from concurrent slots does not interleave.
+        """
+        begin_progress()
+        try:
+            # Rotate proxy after max uses (anti-detection)
+            if self.browser_manager and _proxies_cache and self.uses >= _max_uses_per_proxy:
+                old_proxy = self.browser_manager.proxy_config.server if self.browser_manager.proxy_config else "None"
+                proxy_config = self.take_proxy(self.browser_manager.proxy_config)
+                new_proxy = proxy_config.server if proxy_config else "None"
+                log_progress(f"[*] PROXY ROTATION: {old_proxy} -> {new_proxy}")
+                log_progress(f"[*] Reason: Used {_max_uses_per_proxy} times (anti-detection)")
+                time.sleep(2)  # Brief pause between browser sessions (human-like)
+                self.browser_manager.new_context(proxy_config)
+                self.uses = 0
+            
+            if self.browser_manager is None:
+                proxy_config = self.take_proxy() if _proxies_cache else None
+                browser_manager = BrowserManager(proxy_config)
+                try:
+                    browser_manager.launch_browser()
+                except Exception:
+                    # Stop whatever did start; the slot stays empty so its next URL relaunches
+                    browser_manager.close_browser()
+                    raise
+                self.browser_manager = browser_manager
+                self.uses = 0
+            
+            self.uses += 1
+            return fetch_page_data(url, self.browser_manager, add_delay)
+        finally:
+            flush_progress()
+    
+    def close(self):
+        """Close this slot's browser (runs on the slot thread)"""
+        if self.browser_manager:
+            self.browser_manager.close_browser()
+            self.browser_manager = None
+
+
+async def preflight_url(session, url: str) -> Optional[str]:
+    """
+    Cheaply check a URL with a HEAD request before spending a browser on it.
+    
+    Only definite failures are reported: a host that does not resolve or
+    refuses connections, a 404/410, or a response that is not a web page.
+    Anything inconclusive (timeouts, 403/405 from servers that reject HEAD
+    or bots) lets the browser try.
+    
+    Args:
+        session: Shared aiohttp.ClientSession
+        url: URL to check
+        
+    Returns:
+        Reason to skip the URL, or None if it should be scraped
+    """
+    try:
+        async with session.head(url, allow_redirects=True) as response:
+            if response.status in (404, 410):
+                return f"HTTP {response.status}"
+            content_type = response.headers.get('Content-Type', '')
+            if content_type and 'html' not in content_type.lower():
+                return f"not a web page ({content_type.split(';')[0].strip()})"
+    except aiohttp.ClientConnectorError:
+        return "host unreachable"
+    except Exception:
+        pass
+    return None
+
+
+async def scrape_urls(urls: List[str], csv_filename: str, max_concurrency: int = 5) -> Tuple[int, int]:
+    """
+    Scrape URLs concurrently across a bounded pool of warm browsers.
+    
+    Page loads overlap instead of running back to back, so wall time drops
+    from the sum of page latencies to roughly that sum divided by
+    max_concurrency. URLs are interleaved by host first so concurrent
+    workers do not all hit the same site, and loads on one host are spaced
+    2-5s apart. Results are saved and displayed from the event loop thread,
+    one at a time.
+    
+    When aiohttp is installed and no proxies are loaded, each URL first gets
+    a HEAD pre-flight over one shared, DNS-caching session, and dead URLs
+    are skipped without a page load. With proxies it is skipped, as a direct
+    request would expose the real IP.
+    
+    Args:
+        urls: URLs to scrape
+        csv_filename: CSV file to save results to
+        max_concurrency: Maximum number of pages loading at once
+        
+    Returns:
+        Tuple of (successful, failed) counts
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    proxy_pool = deque(_proxies_cache)
+    slots = [BrowserSlot(proxy_pool) for _ in range(min(max_concurrency, len(urls)))]
+    free_slots = list(slots)
+    host_next_start: Dict[str, float] = {}  # Earliest start of the next page load per host
+    host_locks: Dict[str, asyncio.Lock] = {}  # One URL per host at a time waits for its turn
+    
+    session = None
+    if AIOHTTP_AVAILABLE and not _proxies_cache:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=max_concurrency * 4, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=5)
+        )
+    
+    async def scrape_one(url: str) -> Optional[ScrapedData]:
+        if session is not None:
+            reason = await preflight_url(session, url)
+            if reason:
+                print(f"[!] Skipping {url}: {reason}")
+                return None
+        
+        # Space page loads on the same host 2-5s apart (human-like behavior). The
+        # host's lock is held from the wait until a slot is taken, so the gap is
+        # measured from when loads actually start; the wait itself holds no slot,
+        # so browsers keep loading other hosts meanwhile.
+        host = urlsplit(url).netloc.lower()
+        async with host_locks.setdefault(host, asyncio.Lock()):
+            delay = host_next_start.get(host, 0.0) - loop.time()
+            if delay > 0:
+                print(f"[*] Waiting {delay:.1f}s before {url} (anti-detection)...")
+                await asyncio.sleep(delay)
+            await semaphore.acquire()
+            host_next_start[host] = loop.time() + random.uniform(2, 5)  # Random delay between 2-5 seconds
+        
+        try:
+            slot = free_slots.pop()
+            try:
+                data = await loop.run_in_executor(slot.executor, slot.scrape, url, False)
+            finally:
+                free_slots.append(slot)
+        finally:
+            semaphore.release()
+        
+        if data:
+            save_to_csv(data, csv_filename)
+            display_summary(data)
+        return data
+    
+    ordered = interleave_by_host(urls)
+    try:
+        results = await asyncio.gather(
+            *[scrape_one(url) for url in ordered],
+            return_exceptions=True
+        )
+    finally:
+        close_csv(csv_filename)
+        if session is not None:
+            await session.close()
+        
+        # Each browser has to be closed on the thread that launched it
+        for slot in slots:
+            await loop.run_in_executor(slot.executor, slot.close)
+            slot.executor.shutdown(wait=True)
+    
+    # Errors escaping a URL's task (browser launch, CSV write...) still count as failures
+    for url, result in zip(ordered, results):
+        if isinstance(result, BaseException):
+            display_error(f"{url}: {result}")
+    
+    successful = sum(1 for result in results if isinstance(result, ScrapedData))
+    return successful, len(results) - successful
 
 
 def main():
@@ -1552,8 +2185,6 @@ def main():
     print("=" * 60)
     print()
     
-    browser_manager = None
-    
     try:
         # Step 1: Load proxies (optional)
         print("[*] Step 1: Loading proxy configuration...")
@@ -1574,55 +2205,14 @@ def main():
         print(f"[+] Results will be saved to: {csv_filename}")
         print()
         
-        # Step 3: Launch browser with first proxy
-        print("[*] Step 3: Launching browser...")
-        proxy_config = get_next_proxy() if proxies else None
-        browser_manager = BrowserManager(proxy_config)
-        browser_manager.launch_browser()
-        print()
-        
-        # Step 4: Process each URL with smart proxy rotation
-        print("[*] Step 4: Processing URLs...")
+        # Step 3: Process URLs concurrently with smart proxy rotation
+        print("[*] Step 3: Processing URLs...")
         if proxies:
             print(f"[*] Smart proxy rotation: Changes proxy every {_max_uses_per_proxy} uses")
             print(f"[*] Total proxies available: {len(proxies)}")
         print()
         
-        successful = 0
-        failed = 0
-        
-        for idx, url in enumerate(urls):
-            # Add delay after first URL (human-like behavior)
-            add_delay = idx > 0
-            
-            # Check if we need to rotate proxy (every 7 uses)
-            if proxies and _proxy_usage_count >= _max_uses_per_proxy:
-                old_proxy = proxy_config.server if proxy_config else "None"
-                
-                # Close current browser
-                browser_manager.close_browser()
-                
-                # Get next proxy (will auto-rotate due to usage count)
-                proxy_config = get_next_proxy()
-                new_proxy = proxy_config.server if proxy_config else "None"
-                
-                print()
-                print(f"[*] PROXY ROTATION: {old_proxy} -> {new_proxy}")
-                print(f"[*] Reason: Used {_max_uses_per_proxy} times (anti-detection)")
-                print()
-                
-                # Brief pause between browser sessions (human-like)
-                time.sleep(2)
-                
-                # Relaunch browser with new proxy
-                browser_manager = BrowserManager(proxy_config)
-                browser_manager.launch_browser()
-            
-            result = scrape_single_url(url, browser_manager, csv_filename, add_delay)
-            if result:
-                successful += 1
-            else:
-                failed += 1
+        successful, failed = asyncio.run(scrape_urls(urls, csv_filename))
         
         # Final summary
         print()
@@ -1641,13 +2231,6 @@ def main():
         
     except Exception as e:
         display_error(f"An unexpected error occurred: {str(e)}")
-        
-    finally:
-        # Always cleanup browser
-        if browser_manager:
-            print("[*] Cleaning up...")
-            browser_manager.close_browser()
-            print()
 
 
 if __name__ == "__main__":
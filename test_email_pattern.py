@@ -0,0 +1,28 @@
+"""
+Regression cases for the email alternatives of scraper's combined page pattern
+"""
+import pytest
+
+from scraper import scan_page
+
+
+@pytest.mark.parametrize("text", [
+    'logo@2x.png',
+    '<script src="sprite@2x.min.js">',
+    'x@2x.min.js',
+    'x@2x.retina.png',
+    'bg@3x.webp',
+])
+def test_asset_names_are_not_emails(text):
+    assert scan_page(text).emails == []
+
+
+@pytest.mark.parametrize("text, email", [
+    ('Write to info@example.com.', 'info@example.com'),
+    ('sales@mail.example.co.uk today', 'sales@mail.example.co.uk'),
+    ('john.jsmith@corp.io', 'john.jsmith@corp.io'),
+    ('contact [at] example.com', 'contact@example.com'),
+    ('hello@example [dot] com', 'hello@example.com'),
+])
+def test_emails_are_found(text, email):
+    assert scan_page(text).emails == [email]
@@ -19,9 +19,10 @@ print("TESTING MIXED URLs (Valid + Social Media)")
 print("=" * 60)
 print()
 
-for url in test_urls:
-    is_valid, error_msg = scraper.validate_url(url)
-    
+# Validate each URL once; the summary below reuses these results
+validations = [(url, *scraper.validate_url(url)) for url in test_urls]
+
+for url, is_valid, error_msg in validations:
     if is_valid:
         print(f"✅ {url}")
         print(f"   → Will be scraped")
@@ -33,7 +34,7 @@ for url in test_urls:
 print("=" * 60)
 print("SUMMARY")
 print("=" * 60)
-valid_count = sum(1 for url in test_urls if scraper.validate_url(url)[0])
+valid_count = sum(1 for _, is_valid, _ in validations if is_valid)
 invalid_count = len(test_urls) - valid_count
 
 print(f"Total URLs:     {len(test_urls)}")
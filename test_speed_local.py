@@ -13,22 +13,41 @@ from apify_scraper_async import AsyncWebsiteScraper
 # Extract URLs from test_urls.txt
 def load_urls():
     with open('test_urls.txt', 'r') as f:
-        content = f.read()
-        # Parse the JSON-like structure
-        urls = []
-        for line in content.split('\n'):
-            if '"url":' in line:
-                url = line.split('"url":')[1].strip().strip('"').strip(',').strip()
-                if url:
-                    urls.append(url)
-        return urls
+        data = json.load(f)
+    # Accept a bare list or Apify-style input ({"urls": [...]}) of {"url": ...} items or plain strings
+    if isinstance(data, dict):
+        data = data.get('urls', [])
+    urls = [item.get('url', '') if isinstance(item, dict) else item for item in data]
+    return [url.strip() for url in urls if url and url.strip()]
 
-async def scrape_with_semaphore(url, scraper, semaphore, results, index, total):
+CSV_FIELDNAMES = (
+    'url', 'title', 'emails', 'phones', 'address',
+    'social_links', 'email_count', 'phone_count', 'social_count',
+    'confidence_score', 'scrape_timestamp'
+)
+
+def to_row(result):
+    """Flatten a result dict into a CSV row tuple, in CSV_FIELDNAMES order"""
+    get = result.get
+    return (
+        get('url', ''),
+        get('title', ''),
+        ', '.join(get('emails', ())),
+        ', '.join(get('phones', ())),
+        get('address', ''),
+        ', '.join(get('social_links', ())),
+        get('email_count', 0),
+        get('phone_count', 0),
+        get('social_count', 0),
+        get('confidence_score', 0),
+        get('scrape_timestamp', '')
+    )
+
+async def scrape_with_semaphore(url, scraper, semaphore, index, total):
     """Scrape a single URL with semaphore control"""
     async with semaphore:
         print(f"[{index}/{total}] Scraping: {url}")
         result = await scraper.scrape_url(url)
-        results.append(result)
         print(f"✓ [{index}/{total}] Done: {result['email_count']} emails, {result['phone_count']} phones")
         return result
 
@@ -54,23 +73,46 @@ async def main():
     print(f"⏱️  Start time: {start_datetime.strftime('%H:%M:%S')}")
     print()
     
+    # Open the CSV up front so rows are written as each URL finishes
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    csv_filename = f'speed_test_results_{timestamp}.csv'
+    
+    # Rolling stats, so no list of results is kept
+    processed = total_emails = total_phones = total_socials = successful = 0
+    
     # Initialize scraper
     scraper = AsyncWebsiteScraper(use_proxy=False)
     await scraper.start()
     
     try:
-        # Create semaphore for concurrency control
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT)
-        results = []
-        
-        # Create tasks for all URLs
-        tasks = [
-            scrape_with_semaphore(url, scraper, semaphore, results, i+1, len(urls))
-            for i, url in enumerate(urls)
-        ]
-        
-        # Run all tasks in parallel
-        await asyncio.gather(*tasks, return_exceptions=True)
+        with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDNAMES)
+            
+            # Create semaphore for concurrency control
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+            
+            # Create tasks for all URLs
+            tasks = [
+                scrape_with_semaphore(url, scraper, semaphore, i+1, len(urls))
+                for i, url in enumerate(urls)
+            ]
+            
+            # Run all tasks in parallel, handling each result as soon as it completes
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    result = await next_done
+                except Exception:
+                    continue
+                
+                processed += 1
+                total_emails += result.get('email_count', 0)
+                total_phones += result.get('phone_count', 0)
+                total_socials += result.get('social_count', 0)
+                if result.get('email_count', 0) > 0 or result.get('phone_count', 0) > 0:
+                    successful += 1
+                
+                writer.writerow(to_row(result))
         
     finally:
         await scraper.close()
@@ -80,12 +122,6 @@ async def main():
     end_datetime = datetime.now()
     elapsed = end_time - start_time
     
-    # Calculate stats
-    total_emails = sum(r.get('email_count', 0) for r in results)
-    total_phones = sum(r.get('phone_count', 0) for r in results)
-    total_socials = sum(r.get('social_count', 0) for r in results)
-    successful = len([r for r in results if r.get('email_count', 0) > 0 or r.get('phone_count', 0) > 0])
-    
     # Print results
     print()
     print("=" * 70)
@@ -93,7 +129,7 @@ async def main():
     print("=" * 70)
     print(f"⏱️  End time: {end_datetime.strftime('%H:%M:%S')}")
     print(f"⏱️  Total time: {elapsed:.1f} seconds ({elapsed/60:.2f} minutes)")
-    print(f"📊 URLs processed: {len(results)}")
+    print(f"📊 URLs processed: {processed}")
     print(f"📧 Total emails found: {total_emails}")
     print(f"📱 Total phones found: {total_phones}")
     print(f"🔗 Total social links: {total_socials}")
@@ -102,33 +138,6 @@ async def main():
     print(f"⚡ Average: {elapsed/len(urls):.2f} seconds per URL")
     print("=" * 70)
     
-    # Save to CSV
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    csv_filename = f'speed_test_results_{timestamp}.csv'
-    
-    with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=[
-            'url', 'title', 'emails', 'phones', 'address', 
-            'social_links', 'email_count', 'phone_count', 'social_count',
-            'confidence_score', 'scrape_timestamp'
-        ])
-        writer.writeheader()
-        
-        for result in results:
-            writer.writerow({
-                'url': result.get('url', ''),
-                'title': result.get('title', ''),
-                'emails': ', '.join(result.get('emails', [])),
-                'phones': ', '.join(result.get('phones', [])),
-                'address': result.get('address', ''),
-                'social_links': ', '.join(result.get('social_links', [])),
-                'email_count': result.get('email_count', 0),
-                'phone_count': result.get('phone_count', 0),
-                'social_count': result.get('social_count', 0),
-                'confidence_score': result.get('confidence_score', 0),
-                'scrape_timestamp': result.get('scrape_timestamp', '')
-            })
-    
     print(f"💾 Results saved to: {csv_filename}")
     print()
     
@@ -149,7 +158,7 @@ async def main():
         f.write(f"- Emails found: {total_emails}\n")
         f.write(f"- Phones found: {total_phones}\n")
         f.write(f"- Social links: {total_socials}\n")
-        f.write(f"- Successful scrapes: {successful}/{len(results)}\n")
+        f.write(f"- Successful scrapes: {successful}/{processed}\n")
     
     print(f"📄 Report saved to: {report_filename}")
     print()
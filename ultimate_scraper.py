@@ -18,37 +18,252 @@ import csv
 import re
 import sys
 import argparse
+from html import unescape
+from html.parser import HTMLParser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from dataclasses import asdict, fields
 from typing import List, Dict, Optional
 from pathlib import Path
+from urllib.parse import urlsplit
 from bs4 import BeautifulSoup
+from yarl import URL
 
 # Import browser scraper components
 from scraper import (
-    BrowserManager, load_proxies, get_next_proxy, reset_proxy_usage,
-    extract_emails, extract_phones, extract_address, extract_social_links,
-    extract_external_links, extract_descriptions, extract_messaging_links,
-    extract_metadata, extract_title, extract_url,
-    infer_industry, detect_contact_form, calculate_word_count,
-    detect_blog, detect_products_services,
-    clean_text, normalize_data, apply_defaults,
-    generate_timestamp, ScrapedData
+    BrowserManager, ScrapedData, load_proxies, get_next_proxy, reset_proxy_usage,
+    extract_page_data
 )
 
+# Optional: non-blocking c-ares DNS resolver for aiohttp (pip install aiodns)
+try:
+    import aiodns
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+# Patterns for the HTTP path, compiled once at import
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_PATTERN = re.compile(r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+# All social platforms in one alternation, so the HTML is scanned once instead of once per domain
+SOCIAL_PATTERN = re.compile(r'https?://(?:www\.)?(?:facebook|instagram|twitter|linkedin|youtube)\.com/[^\s"\'>]+')
+BLOG_PATTERN = re.compile(r'blog|article', re.IGNORECASE)
+
+# Read at most this much of a response body; contact details live well within it
+MAX_HTML_BYTES = 2_000_000
+
+# Markup removed to estimate a page's visible text without building a DOM
+TAG_STRIP_PATTERN = re.compile(
+    r'<script\b.*?</script\s*>|<style\b.*?</style\s*>|<template\b.*?</template\s*>|<!--.*?-->|<[^>]+>',
+    re.DOTALL | re.IGNORECASE
+)
+FORM_TAG_PATTERN = re.compile(r'<form\b', re.IGNORECASE)
+
+# Fields written as "NONE" (not blank) when nothing was found, as in scraper.py's output
+NONE_IF_EMPTY = frozenset({'emails', 'phones'})
+
+# Every column a result can have: browser results carry all ScrapedData fields,
+# HTTP results a subset, and skipped/failed rows add status and reason
+CSV_FIELDNAMES = sorted({f.name for f in fields(ScrapedData)} | {'method', 'status', 'reason'})
+
+# Title and meta description sit in <head>; never scan further than this for them
+HEAD_SCAN_CHARS = 65536
+
+# Markers of heavy JavaScript frameworks, matched against the lowercased HTML (so lowercase here)
+JS_INDICATORS = (
+    'react', 'angular', 'vue.js', 'next.js',
+    '__next_data__', 'ng-app', 'v-app',
+    'data-reactroot', 'data-react-helmet'
+)
+
+
+async def read_capped(response, limit: int) -> bytes:
+    """
+    Read a response body up to limit bytes, leaving the rest unread.
+    
+    Args:
+        response: aiohttp response to read
+        limit: Maximum number of bytes to return
+        
+    Returns:
+        The first limit bytes of the body (all of it if shorter)
+    """
+    chunks = []
+    remaining = limit
+    while remaining > 0:
+        # read(n) returns whatever is buffered (up to n), so keep going until EOF or the cap
+        chunk = await response.content.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+
+def first_unique(values, limit: int = 5) -> List[str]:
+    """
+    Collect the first `limit` distinct values, in order, without consuming the rest
+    
+    Args:
+        values: Iterable of matches (pass a generator to stop scanning early)
+        limit: Maximum number of distinct values to keep
+    """
+    seen = {}
+    for value in values:
+        seen[value] = None
+        if len(seen) >= limit:
+            break
+    return list(seen)
+
+
+def parse_url(url: str) -> Optional[URL]:
+    """
+    Parse a URL once into yarl's URL (the type aiohttp uses internally)
+    
+    A bare "facebook.com/page" is read as host + path, so its host can still
+    be checked; it parses with an empty scheme. Returns None if unparseable.
+    """
+    try:
+        parsed = URL(url)
+        return parsed if parsed.is_absolute() else URL('//' + url)
+    except ValueError:
+        return None
+
+
+def url_key(url: str) -> str:
+    """
+    Key under which two spellings of the same page compare equal
+    
+    Scheme and host are case-insensitive; the #fragment and a trailing slash
+    never change what the server returns.
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    path = parts.path.rstrip('/')
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}{path}{query}"
+
+
+def format_csv_row(result: Dict) -> Dict:
+    """Copy of a result with list fields joined into '; '-separated strings"""
+    row = {}
+    for key, value in result.items():
+        if isinstance(value, list):
+            if value:
+                value = '; '.join(map(str, value))
+            else:
+                value = "NONE" if key in NONE_IF_EMPTY else ""
+        row[key] = value
+    return row
+
+
+class _HeadDone(Exception):
+    """Raised inside HeadParser once <head> is over"""
+
+
+class HeadParser(HTMLParser):
+    """Collects <title> and meta description, stopping at </head> or <body>"""
+    
+    def __init__(self):
+        super().__init__()
+        self.title_parts: List[str] = []
+        self.title_done = False
+        self.meta_description: Optional[str] = None
+        self._in_title = False
+    
+    def handle_starttag(self, tag, attrs):
+        if tag == 'body':
+            raise _HeadDone
+        if tag == 'title' and not self.title_done:
+            self._in_title = True
+        elif tag == 'meta' and self.meta_description is None:
+            attrs = dict(attrs)
+            if attrs.get('name') == 'description':
+                self.meta_description = attrs.get('content') or ''
+    
+    def handle_endtag(self, tag):
+        if tag == 'title' and self._in_title:
+            self._in_title = False
+            self.title_done = True
+        elif tag == 'head':
+            raise _HeadDone
+    
+    def handle_data(self, data):
+        if self._in_title:
+            self.title_parts.append(data)
+
+
+def parse_head(html: str) -> Dict:
+    """
+    Read title and meta description from the page head without parsing the body
+    
+    Args:
+        html: Raw page HTML
+        
+    Returns:
+        Dict with title and meta_description ("" when not found)
+    """
+    parser = HeadParser()
+    try:
+        parser.feed(html[:HEAD_SCAN_CHARS])
+    except _HeadDone:
+        pass
+    return {'title': ''.join(parser.title_parts), 'meta_description': parser.meta_description or ''}
+
+
+def visible_text(html: str) -> str:
+    """Page text with tags, scripts, styles and comments removed (one regex pass)"""
+    return TAG_STRIP_PATTERN.sub('', html)
+
+
+def parse_html(html: str) -> Dict:
+    """
+    Find the title and meta description anywhere in the document.
+    
+    Fallback for pages parse_head() finds nothing in (no usable <head>), so
+    it runs rarely and a full BeautifulSoup parse is affordable.
+    
+    Args:
+        html: Raw page HTML
+        
+    Returns:
+        Dict with title and meta_description
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    title = soup.title.string if soup.title else ""
+    
+    meta_desc = ""
+    meta_tag = soup.find('meta', attrs={'name': 'description'})
+    if meta_tag:
+        meta_desc = meta_tag.get('content', '')
+    
+    return {'title': title, 'meta_description': meta_desc}
+
 
 class UltimateScraper:
     """
     Hybrid scraper: Fast HTTP + Accurate Browser fallback
     """
     
+    # Browser fallbacks allowed to run at the same time
+    BROWSER_WORKERS = 4
+    
     # Social media and platforms to reject
-    BLOCKED_DOMAINS = [
+    BLOCKED_DOMAINS = frozenset({
         'facebook.com', 'fb.com', 'instagram.com', 'twitter.com', 'x.com',
         'linkedin.com', 'youtube.com', 'tiktok.com', 'snapchat.com',
         'pinterest.com', 'reddit.com', 'tumblr.com', 'whatsapp.com',
         'telegram.org', 't.me', 'discord.com', 'discord.gg',
         'twitch.tv', 'vimeo.com', 'flickr.com', 'medium.com'
-    ]
+    })
+    
+    __slots__ = (
+        'force_browser', 'max_concurrent', 'results', 'stats', 'proxies',
+        '_session', '_browser_pool', '_csv_file', '_csv_writer', '_csv_rows'
+    )
     
     def __init__(self, force_browser=False, max_concurrent=10):
         self.force_browser = force_browser
@@ -65,33 +280,75 @@ class UltimateScraper:
         }
         self.proxies = load_proxies()
         reset_proxy_usage()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._browser_pool: Optional[ThreadPoolExecutor] = None
+        self._csv_file = None
+        self._csv_writer: Optional[csv.DictWriter] = None
+        self._csv_rows = 0
+    
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use.
+        
+        The session (and its pool of kept-alive connections) outlives a
+        single scrape_all() call, so repeat runs reuse open connections.
+        Call aclose() when done with the scraper.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrent, ssl=False,
+                limit_per_host=10,  # Don't pile every connection onto one site
+                keepalive_timeout=30,  # Keep idle connections for reuse by later URLs
+                ttl_dns_cache=300,  # Keep resolved hosts for 5 minutes (aiohttp's default is 10s)
+                resolver=aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None
+            )
+            timeout = aiohttp.ClientTimeout(total=10)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._session
+    
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._browser_pool is not None:
+            self._browser_pool.shutdown(wait=False)
+        self._browser_pool = None
+    
+    def is_blocked_host(self, host: str) -> bool:
+        """Check if a host is a social media platform (or a subdomain of one)"""
+        # Look up the host and each parent domain: m.facebook.com, facebook.com, com
+        labels = host.split('.')
+        return any('.'.join(labels[i:]) in self.BLOCKED_DOMAINS for i in range(len(labels)))
     
     def is_social_media_url(self, url: str) -> bool:
-        """Check if URL is a social media platform"""
-        url_lower = url.lower()
-        for domain in self.BLOCKED_DOMAINS:
-            if domain in url_lower:
-                return True
-        return False
+        """Check if URL's host is a social media platform"""
+        parsed = parse_url(url)
+        return parsed is not None and self.is_blocked_host(parsed.host or '')
     
-    def validate_url(self, url: str) -> tuple[bool, str]:
+    def validate_url(self, url: str) -> tuple[bool, str, Optional[URL]]:
         """
         Validate URL before scraping.
-        Returns: (is_valid, error_message)
+        Returns: (is_valid, error_message, parsed URL to fetch, or None if invalid)
         """
+        parsed = parse_url(url)
+        if parsed is None:
+            return False, "Invalid URL format", None
+        host = parsed.host or ''
+        
         # Check if it's a social media URL
-        if self.is_social_media_url(url):
-            return False, "Social media URLs are not supported (use business websites only)"
+        if self.is_blocked_host(host):
+            return False, "Social media URLs are not supported (use business websites only)", None
         
         # Check if URL has proper format
-        if not url.startswith(('http://', 'https://')):
-            return False, "URL must start with http:// or https://"
+        if parsed.scheme not in ('http', 'https'):
+            return False, "URL must start with http:// or https://", None
         
         # Check for common invalid patterns
-        if url.count('.') < 1:
-            return False, "Invalid URL format (missing domain)"
+        if '.' not in host:
+            return False, "Invalid URL format (missing domain)", None
         
-        return True, ""
+        return True, "", parsed
     
     def needs_browser(self, html: str) -> bool:
         """
@@ -100,91 +357,120 @@ class UltimateScraper:
         """
         if not html:
             return True
-        
+        return self.has_js_framework(html) or self.is_mostly_empty(visible_text(html))
+    
+    def has_js_framework(self, html: str) -> bool:
+        """Check the raw HTML for JavaScript framework markers (no parsing)"""
         # Check for heavy JavaScript frameworks
-        js_indicators = [
-            'react', 'angular', 'vue.js', 'next.js',
-            '__NEXT_DATA__', 'ng-app', 'v-app',
-            'data-reactroot', 'data-react-helmet'
-        ]
-        
         html_lower = html.lower()
-        for indicator in js_indicators:
+        for indicator in JS_INDICATORS:
             if indicator in html_lower:
                 return True
-        
-        # Check if page is mostly empty (likely needs JS)
-        soup = BeautifulSoup(html, 'html.parser')
-        text = soup.get_text().strip()
-        if len(text) < 200:  # Very little content
-            return True
-        
         return False
     
-    async def try_http_scrape(self, session, url):
-        """Try fast HTTP scraping first"""
+    def is_mostly_empty(self, text: str) -> bool:
+        """Check if a page's visible_text() is so short it likely needs JS"""
+        return len(text.strip()) < 200  # Very little content
+    
+    async def fetch_html(self, session, url, proxy_config=None) -> tuple[int, str]:
+        """
+        GET a page over HTTP, optionally through a proxy
+        
+        Args:
+            session: Shared aiohttp session
+            url: URL to fetch (str or an already-parsed URL)
+            proxy_config: ProxyConfig to route the request through, or None
+            
+        Returns:
+            (HTTP status, decoded body capped at MAX_HTML_BYTES)
+        """
+        timeout = aiohttp.ClientTimeout(total=10)
+        proxy_kwargs = {}
+        if proxy_config:
+            proxy_kwargs['proxy'] = proxy_config.server
+            if proxy_config.username:
+                proxy_kwargs['proxy_auth'] = aiohttp.BasicAuth(proxy_config.username, proxy_config.password or '')
+        
+        async with session.get(url, timeout=timeout, ssl=False, **proxy_kwargs) as response:
+            # Capped read, decoded with the declared charset (no full-body detection pass)
+            raw = await read_capped(response, MAX_HTML_BYTES)
+            try:
+                html = raw.decode(response.charset or 'utf-8', errors='replace')
+            except LookupError:  # Unknown charset name in the Content-Type header
+                html = raw.decode('utf-8', errors='replace')
+            return response.status, html
+    
+    async def try_http_scrape(self, session, url, parsed: Optional[URL] = None):
+        """Try fast HTTP scraping first (fetching `parsed`, when given, so aiohttp skips re-parsing)"""
+        target = parsed or url
         try:
-            timeout = aiohttp.ClientTimeout(total=10)
-            async with session.get(url, timeout=timeout, ssl=False) as response:
-                html = await response.text()
-                
-                # Check if browser needed
-                if self.needs_browser(html):
-                    return None, "needs_browser"
-                
-                # Parse with BeautifulSoup
-                data = self.parse_http_response(url, html)
-                return data, "http_success"
+            proxy_config = get_next_proxy() if self.proxies else None
+            try:
+                status, html = await self.fetch_html(session, target, proxy_config)
+            except aiohttp.ClientError:
+                if not proxy_config:
+                    raise
+                status = None  # Proxy refused or dropped the connection
+            
+            # Blocked (or the proxy failed): one retry through the next proxy
+            # is far cheaper than falling back to a browser
+            if proxy_config and status in (None, 403, 429):
+                print(f"  → HTTP blocked ({status or 'proxy error'}), retrying with next proxy...")
+                status, html = await self.fetch_html(session, target, get_next_proxy(force_rotate=True))
+            
+            # Check if browser needed on the raw string, so pages headed
+            # for the browser are never parsed
+            if not html or self.has_js_framework(html):
+                return None, "needs_browser"
+            text = visible_text(html)
+            if self.is_mostly_empty(text):
+                return None, "needs_browser"
+            
+            data = self.parse_http_response(url, html, text)
+            return data, "http_success"
                 
         except Exception as e:
             return None, f"http_error: {str(e)}"
     
-    def parse_http_response(self, url, html):
-        """Parse HTTP response quickly"""
-        soup = BeautifulSoup(html, 'html.parser')
+    def parse_http_response(self, url, html, text: Optional[str] = None):
+        """
+        Parse HTTP response quickly
         
-        # Extract basic data
-        title = soup.title.string if soup.title else ""
+        Args:
+            url: URL the page was fetched from
+            html: Raw page HTML
+            text: visible_text() of this HTML, computed here if not given
+        """
+        head = parse_head(html)
+        if not head['title'] and not head['meta_description']:
+            head = parse_html(html)  # No usable <head>: look through the whole document
+        title = head['title']
+        meta_desc = head['meta_description']
         
-        meta_desc = ""
-        meta_tag = soup.find('meta', attrs={'name': 'description'})
-        if meta_tag:
-            meta_desc = meta_tag.get('content', '')
+        if text is None:
+            text = visible_text(html)
         
-        # Extract emails
-        emails = []
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        emails = re.findall(email_pattern, html)
-        emails = [e.lower() for e in emails if '@' in e and '.' in e.split('@')[1]]
-        emails = list(set(emails))[:5]
+        # Extract emails (the pattern already requires an @ and a dotted domain)
+        emails = first_unique(m.group().lower() for m in EMAIL_PATTERN.finditer(html))
         
         # Extract phones
-        phones = []
-        phone_pattern = r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phones = re.findall(phone_pattern, html)
-        phones = list(set(phones))[:5]
+        phones = first_unique(m.group() for m in PHONE_PATTERN.finditer(html))
         
         # Extract social links
-        social_domains = ['facebook.com', 'instagram.com', 'twitter.com', 'linkedin.com', 'youtube.com']
-        social_links = []
-        for domain in social_domains:
-            pattern = rf'https?://(?:www\.)?{re.escape(domain)}/[^\s"\'>]+'
-            social_links.extend(re.findall(pattern, html))
-        social_links = list(set(social_links))[:5]
+        social_links = first_unique(m.group() for m in SOCIAL_PATTERN.finditer(html))
         
-        # Word count
-        text = soup.get_text()
-        word_count = len(text.split())
+        # Word count (entities decoded, so &nbsp; separates words as in the browser)
+        word_count = len(unescape(text).split())
         
         # Features
-        has_form = bool(soup.find('form'))
-        has_blog = bool(re.search(r'blog|article', html, re.IGNORECASE))
+        has_form = bool(FORM_TAG_PATTERN.search(html))
+        has_blog = bool(BLOG_PATTERN.search(html))
         
         return {
             'url': url,
             'title': title[:100] if title else "",
-            'emails': emails if emails else "NONE",
-            'phones': phones if phones else "NONE",
+            'emails': emails,
+            'phones': phones,
             'social_links': social_links,
             'meta_description': meta_desc[:200] if meta_desc else "",
             'word_count': word_count,
@@ -214,73 +500,9 @@ class UltimateScraper:
             browser_manager.scroll_to_bottom()
             
             # Extract data (using existing accurate functions)
-            page = browser_manager.page
-            
-            extracted_url = extract_url(page)
-            title = extract_title(page)
-            metadata = extract_metadata(page)
-            emails = extract_emails(page)
-            phones = extract_phones(page)
-            address_data = extract_address(page)
-            social_links = extract_social_links(page)
-            external_links = extract_external_links(page)
-            description = extract_descriptions(page)
-            messaging = extract_messaging_links(page)
-            
-            industry = infer_industry(page)
-            contact_form = detect_contact_form(page)
-            word_count = calculate_word_count(page)
-            blog_present = detect_blog(page)
-            products_or_services = detect_products_services(page)
-            
-            timestamp = generate_timestamp()
-            
-            # Clean data
-            emails = clean_text(normalize_data(emails))
-            phones = clean_text(phones)
-            social_links = clean_text(normalize_data(social_links))
-            external_links = clean_text(normalize_data(external_links))
-            emails, phones = apply_defaults(emails, phones)
-            
-            # Calculate metrics
-            email_count = len(emails) if isinstance(emails, list) else 0
-            phone_count = len(phones) if isinstance(phones, list) else 0
-            social_count = len(social_links) if isinstance(social_links, list) else 0
-            
-            # Format address: use full address with country if available
-            address_str = address_data.get('full', '')
-            if not address_str and address_data.get('country'):
-                # If no full address but have country, just use country
-                address_str = address_data.get('country', '')
-            
-            return {
-                'url': extracted_url,
-                'title': title,
-                'emails': emails,
-                'phones': phones,
-                'social_links': social_links,
-                'external_links': external_links,
-                'description': description,
-                'meta_description': metadata.get('meta_description', ''),
-                'og_title': metadata.get('og_title', ''),
-                'og_description': metadata.get('og_description', ''),
-                'og_image': metadata.get('og_image', ''),
-                'address': address_str,  # Single address field
-                'whatsapp': messaging.get('whatsapp', ''),
-                'telegram': messaging.get('telegram', ''),
-                'signal': messaging.get('signal', ''),
-                'discord': messaging.get('discord', ''),
-                'contact_form': contact_form,
-                'industry': industry,
-                'blog_present': blog_present,
-                'products_or_services': products_or_services,
-                'word_count': word_count,
-                'scrape_timestamp': timestamp,
-                'email_count': email_count,
-                'phone_count': phone_count,
-                'social_count': social_count,
-                'method': 'browser'
-            }
+            data = asdict(extract_page_data(browser_manager.page))
+            data['method'] = 'browser'
+            return data
             
         except Exception as e:
             print(f"  → Browser scraping failed: {e}")
@@ -289,12 +511,28 @@ class UltimateScraper:
             if browser_manager:
                 browser_manager.close_browser()
     
+    async def browser_scrape_async(self, url):
+        """
+        Run browser_scrape on a worker thread so other URLs keep going meanwhile.
+        
+        Browser fallbacks get their own small pool: each one launches a whole
+        Chromium process, so at most BROWSER_WORKERS run at once while HTTP
+        scrapes carry on at full concurrency.
+        """
+        if self._browser_pool is None:
+            self._browser_pool = ThreadPoolExecutor(
+                max_workers=min(self.BROWSER_WORKERS, self.max_concurrent),
+                thread_name_prefix='browser'
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._browser_pool, self.browser_scrape, url)
+    
     async def scrape_url(self, session, url, index, total):
         """Scrape a single URL with hybrid approach"""
         print(f"\n[{index}/{total}] {url}")
         
         # Validate URL first
-        is_valid, error_msg = self.validate_url(url)
+        is_valid, error_msg, parsed = self.validate_url(url)
         if not is_valid:
             print(f"  ✗ SKIPPED: {error_msg}")
             self.stats['skipped'] += 1
@@ -303,7 +541,7 @@ class UltimateScraper:
         # Force browser mode
         if self.force_browser:
             print(f"  → Using BROWSER (forced mode)")
-            data = self.browser_scrape(url)
+            data = await self.browser_scrape_async(url)
             if data:
                 self.stats['browser_success'] += 1
                 return data
@@ -313,7 +551,7 @@ class UltimateScraper:
         
         # Try HTTP first
         print(f"  → Trying FAST HTTP...")
-        data, status = await self.try_http_scrape(session, url)
+        data, status = await self.try_http_scrape(session, url, parsed)
         
         if status == "http_success":
             print(f"  ✓ HTTP Success (FAST)")
@@ -322,7 +560,7 @@ class UltimateScraper:
         
         elif status == "needs_browser":
             print(f"  → JavaScript detected, switching to BROWSER...")
-            data = self.browser_scrape(url)
+            data = await self.browser_scrape_async(url)
             if data:
                 self.stats['browser_success'] += 1
                 return data
@@ -333,7 +571,7 @@ class UltimateScraper:
         else:
             # HTTP failed, try browser
             print(f"  → HTTP failed, trying BROWSER...")
-            data = self.browser_scrape(url)
+            data = await self.browser_scrape_async(url)
             if data:
                 self.stats['browser_success'] += 1
                 return data
@@ -343,6 +581,13 @@ class UltimateScraper:
     
     async def scrape_all(self, urls):
         """Scrape all URLs with hybrid approach"""
+        # Each page once, however often (or however spelled) it appears in the input
+        unique = {}
+        for url in urls:
+            unique.setdefault(url_key(url), url)  # First spelling wins
+        duplicates = len(urls) - len(unique)
+        urls = list(unique.values())
+        
         self.stats['total'] = len(urls)
         self.stats['start_time'] = time.time()
         
@@ -350,20 +595,64 @@ class UltimateScraper:
         print("ULTIMATE SCRAPER - Fast + Accurate Hybrid")
         print("=" * 60)
         print(f"URLs to scrape: {len(urls)}")
+        if duplicates:
+            print(f"Duplicates skipped: {duplicates}")
         print(f"Strategy: HTTP first, Browser fallback")
         print("=" * 60)
         
-        timeout = aiohttp.ClientTimeout(total=10)
-        connector = aiohttp.TCPConnector(limit=self.max_concurrent, ssl=False)
+        session = await self.get_session()
+        semaphore = asyncio.Semaphore(self.max_concurrent)
         
-        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-            for i, url in enumerate(urls, 1):
+        async def bounded_scrape(i, url):
+            async with semaphore:
                 data = await self.scrape_url(session, url, i, len(urls))
-                if data:
-                    self.results.append(data)
+            if data:
+                self.add_result(data)
+        
+        # Up to max_concurrent URLs in flight; each result is stored as it completes
+        outcomes = await asyncio.gather(
+            *[bounded_scrape(i, url) for i, url in enumerate(urls, 1)],
+            return_exceptions=True
+        )
+        
+        # An error escaping scrape_url or add_result (e.g. a failed CSV write) fails its URL
+        for url, outcome in zip(urls, outcomes):
+            if isinstance(outcome, Exception):
+                print(f"\n[!] {url} failed: {type(outcome).__name__}: {outcome}")
+                self.stats['failed'] += 1
         
         self.stats['end_time'] = time.time()
     
+    def open_csv(self, filename):
+        """
+        Stream results to a CSV file as they complete instead of keeping them in memory.
+        
+        Args:
+            filename: CSV file to create (overwritten if it exists)
+        """
+        self._csv_file = open(filename, 'w', newline='', encoding='utf-8')
+        self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=CSV_FIELDNAMES, extrasaction='ignore')
+        self._csv_writer.writeheader()
+        self._csv_rows = 0
+    
+    def add_result(self, data: Dict):
+        """Write a result to the open CSV, or keep it in self.results if none is open"""
+        if self._csv_writer is None:
+            self.results.append(data)
+            return
+        self._csv_writer.writerow(format_csv_row(data))
+        self._csv_file.flush()  # Rows written so far survive a crash or Ctrl+C
+        self._csv_rows += 1
+    
+    def close_csv(self):
+        """Close the CSV opened by open_csv()"""
+        if self._csv_file is None:
+            return
+        self._csv_file.close()
+        print(f"\n[+] {self._csv_rows} results saved to: {self._csv_file.name}")
+        self._csv_file = None
+        self._csv_writer = None
+    
     def save_to_csv(self, filename):
         """Save results to CSV"""
         if not self.results:
@@ -371,23 +660,14 @@ class UltimateScraper:
             return
         
         # Determine fieldnames based on data
-        all_keys = set()
-        for result in self.results:
-            all_keys.update(result.keys())
-        
-        fieldnames = sorted(list(all_keys))
-        
-        # Format list fields
-        for result in self.results:
-            for key, value in result.items():
-                if isinstance(value, list):
-                    result[key] = '; '.join(str(v) for v in value) if value else ""
+        fieldnames = sorted(set().union(*self.results))
         
         # Always create new file with headers
         with open(filename, 'w', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
             writer.writeheader()
-            writer.writerows(self.results)
+            # List fields are joined as each row is written; self.results is left as scraped
+            writer.writerows(map(format_csv_row, self.results))
         
         print(f"\n[+] Results saved to: {filename}")
     
@@ -457,7 +737,7 @@ async def main():
         scraper_temp = UltimateScraper()
         invalid_urls = []
         for url in urls[:]:  # Copy list to modify during iteration
-            is_valid, error_msg = scraper_temp.validate_url(url)
+            is_valid, error_msg, _ = scraper_temp.validate_url(url)
             if not is_valid:
                 invalid_urls.append((url, error_msg))
         
@@ -475,10 +755,7 @@ async def main():
     # Create scraper
     scraper = UltimateScraper(force_browser=args.force_browser)
     
-    # Scrape
-    await scraper.scrape_all(urls)
-    
-    # Save
+    # Output file
     if args.output:
         csv_filename = args.output
     else:
@@ -486,7 +763,14 @@ async def main():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         csv_filename = f"ultimate_scrape_{timestamp}.csv"
     
-    scraper.save_to_csv(csv_filename)
+    # Scrape, writing each row as soon as its URL finishes
+    scraper.open_csv(csv_filename)
+    try:
+        await scraper.scrape_all(urls)
+    finally:
+        await scraper.aclose()
+        scraper.close_csv()
+    
     scraper.print_stats()
 
 
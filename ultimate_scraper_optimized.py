@@ -26,25 +26,106 @@ import re
 import sys
 import argparse
 import logging
+import codecs
+import os
+import queue
+import threading
 from datetime import datetime
+from dataclasses import asdict, fields
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
+from urllib.parse import urlsplit
 from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 from functools import partial
+from contextlib import asynccontextmanager
+
+# Optional: libxml2-backed parser for BeautifulSoup (pip install lxml)
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+BS4_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# Optional: on-disk cache of parsed HTTP results between runs (pip install diskcache)
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+CACHE_DIR = '.scraper_cache'
+
+# Optional: non-blocking c-ares DNS resolver for aiohttp (pip install aiodns)
+try:
+    import aiodns
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+# Optional: libuv-based event loop, faster with many tasks in flight (pip install uvloop; not on Windows)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# UTF-8 bodies go to lxml as the raw bytes, skipping a str round trip; invalid
+# sequences become U+FFFD just as bytes.decode(errors='replace') would do
+UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8') if LXML_AVAILABLE else None
+
+# Optional: RE2's linear-time engine for the costliest scans (pip install google-re2)
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Patterns for the HTTP fast path, compiled once at import
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_PATTERN = re.compile(r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+SOCIAL_DOMAINS = ('facebook.com', 'instagram.com', 'twitter.com', 'linkedin.com', 'youtube.com')
+# One alternation finds links to every domain in a single pass over the page
+SOCIAL_PATTERN = re.compile(
+    r'https?://(?:www\.)?(?:' + '|'.join(map(re.escape, SOCIAL_DOMAINS)) + r')/[^\s"\'>]+'
+)
+BLOG_PATTERN = re.compile(r'blog|article', re.IGNORECASE)
+JS_INDICATOR_PATTERN = re.compile(
+    r'react|angular|vue\.js|next\.js|__NEXT_DATA__|ng-app|v-app|data-reactroot|data-react-helmet',
+    re.IGNORECASE
+)
+MIN_TEXT_CHARS = 200  # Pages with less visible text than this likely render with JS
+
+# Email and phone scans start a match attempt at nearly every character, which
+# is where re spends its time; RE2 runs them as a DFA instead. The social and
+# blog patterns begin with literals that re already skips ahead to, so they stay.
+if RE2_AVAILABLE:
+    # RE2's \d and \s are ASCII-only: spell out the Unicode classes re matches
+    _RE2_SPACE = r'\t-\r\x{1c}-\x{1f}\x{85}\p{Z}'  # \s only appears inside [...] here
+    EMAIL_SCANNER = re2.compile(EMAIL_PATTERN.pattern)
+    PHONE_SCANNER = re2.compile(PHONE_PATTERN.pattern.replace(r'\d', r'\p{Nd}').replace(r'\s', _RE2_SPACE))
+else:
+    EMAIL_SCANNER = EMAIL_PATTERN
+    PHONE_SCANNER = PHONE_PATTERN
 
 # Import browser scraper components
 from scraper import (
-    BrowserManager, load_proxies, get_next_proxy, reset_proxy_usage,
-    extract_emails, extract_phones, extract_address, extract_social_links,
-    extract_external_links, extract_descriptions, extract_messaging_links,
-    extract_metadata, extract_title, extract_url,
-    infer_industry, detect_contact_form, calculate_word_count,
-    detect_blog, detect_products_services,
-    clean_text, normalize_data, apply_defaults,
-    generate_timestamp, ScrapedData
+    BrowserSlot, ScrapedData, interleave_by_host, load_proxies, reset_proxy_usage
 )
 
+# Keys of the result dicts each path returns (parse_http_response, browser_scrape_sync);
+# skipped/failed results add status and reason. The CSV header is their union,
+# known before any result arrives, so no pass over the results is needed.
+HTTP_FIELDS = (
+    'url', 'title', 'emails', 'phones', 'social_links', 'meta_description',
+    'word_count', 'contact_form', 'blog_present', 'method'
+)
+BROWSER_FIELDS = tuple(f.name for f in fields(ScrapedData)) + ('method',)
+CSV_FIELDNAMES = sorted(set(HTTP_FIELDS + BROWSER_FIELDS + ('status', 'reason')))
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -57,19 +138,108 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def make_soup(html: str) -> BeautifulSoup:
+    """Parse HTML with lxml when installed, falling back to html.parser if lxml rejects it"""
+    try:
+        return BeautifulSoup(html, BS4_PARSER)
+    except Exception:
+        return BeautifulSoup(html, 'html.parser')
+
+
+def find_all(scanner, pattern: re.Pattern, html: str) -> List[str]:
+    """
+    findall() with the RE2 scanner, falling back to the re pattern
+    
+    RE2 works on UTF-8, so text holding lone surrogates goes through re.
+    """
+    try:
+        return scanner.findall(html)
+    except UnicodeEncodeError:
+        return pattern.findall(html)
+
+
+def first_unique(values, limit: int = 5) -> List[str]:
+    """
+    Collect the first `limit` distinct values, in order, without consuming the rest
+    
+    Args:
+        values: Iterable of matches
+        limit: Maximum number of distinct values to keep
+    """
+    seen = {}
+    for value in values:
+        seen[value] = None
+        if len(seen) >= limit:
+            break
+    return list(seen)
+
+
+def format_csv_row(result: Dict) -> Dict:
+    """Copy of a result with list fields joined into '; '-separated strings"""
+    return {
+        key: '; '.join(map(str, value)) if isinstance(value, list) else value
+        for key, value in result.items()
+    }
+
+
+def parse_page(html: str, raw_utf8: Optional[bytes] = None) -> Dict:
+    """
+    Pull title, meta description, form presence and page text from HTML.
+    
+    Reads the lxml tree directly when lxml is installed (no BeautifulSoup
+    objects are built); otherwise parses with BeautifulSoup.
+    
+    Args:
+        html: Raw page HTML
+        raw_utf8: The undecoded body, if it is UTF-8 (lxml then parses the bytes)
+        
+    Returns:
+        Dict with title, meta_description, has_form and text (the page text,
+        as BeautifulSoup's get_text() would return it)
+    """
+    if LXML_AVAILABLE:
+        try:
+            if raw_utf8 is not None:
+                doc = lxml_html.fromstring(raw_utf8, parser=UTF8_HTML_PARSER)
+            else:
+                doc = lxml_html.fromstring(html)
+        except (etree.ParserError, ValueError):  # Empty document, or a str with an XML encoding declaration
+            doc = None
+        if doc is not None:
+            title = doc.findtext('.//title') or ""
+            meta_desc = doc.xpath('string(//meta[@name="description"]/@content)')
+            has_form = doc.find('.//form') is not None
+            # get_text() leaves out script/style/template contents; match it
+            etree.strip_elements(doc, 'script', 'style', 'template', with_tail=False)
+            return {'title': title, 'meta_description': meta_desc, 'has_form': has_form, 'text': doc.text_content()}
+    
+    soup = make_soup(html)
+    title = soup.title.string if soup.title else ""
+    meta_desc = ""
+    meta_tag = soup.find('meta', attrs={'name': 'description'})
+    if meta_tag:
+        meta_desc = meta_tag.get('content', '')
+    return {'title': title, 'meta_description': meta_desc, 'has_form': bool(soup.find('form')), 'text': soup.get_text()}
+
+
 class OptimizedScraper:
     """
     Fully optimized hybrid scraper with parallel processing and browser reuse
     """
     
+    # Circuit breaker: after this many timeouts/connection errors in a row, a
+    # host's remaining URLs are failed fast until the cooldown (seconds) passes
+    CIRCUIT_FAILURES = 3
+    CIRCUIT_COOLDOWN = 60
+    
     # Social media and platforms to reject
-    BLOCKED_DOMAINS = [
+    BLOCKED_DOMAINS = frozenset({
         'facebook.com', 'fb.com', 'instagram.com', 'twitter.com', 'x.com',
         'linkedin.com', 'youtube.com', 'tiktok.com', 'snapchat.com',
         'pinterest.com', 'reddit.com', 'tumblr.com', 'whatsapp.com',
         'telegram.org', 't.me', 'discord.com', 'discord.gg',
         'twitch.tv', 'vimeo.com', 'flickr.com', 'medium.com'
-    ]
+    })
     
     def __init__(
         self,
@@ -77,13 +247,17 @@ class OptimizedScraper:
         max_concurrent=10,
         retry_attempts=2,
         rate_limit_delay=0.5,
-        browser_pool_size=3
+        browser_pool_size=3,
+        max_per_host=2,
+        cache_ttl=86400
     ):
         self.force_browser = force_browser
         self.max_concurrent = max_concurrent
         self.retry_attempts = retry_attempts
         self.rate_limit_delay = rate_limit_delay
         self.browser_pool_size = browser_pool_size
+        self.max_per_host = max_per_host
+        self.cache_ttl = cache_ttl
         
         self.results = []
         self.stats = {
@@ -93,6 +267,7 @@ class OptimizedScraper:
             'failed': 0,
             'skipped': 0,
             'retries': 0,
+            'cache_hits': 0,
             'start_time': None,
             'end_time': None
         }
@@ -100,23 +275,73 @@ class OptimizedScraper:
         self.proxies = load_proxies()
         reset_proxy_usage()
         
-        # Thread pool for browser operations
-        self.executor = ThreadPoolExecutor(max_workers=browser_pool_size)
+        # Parsed HTTP results from earlier runs, keyed by URL (off if cache_ttl is 0/None)
+        self.cache = diskcache.Cache(CACHE_DIR) if DISKCACHE_AVAILABLE and cache_ttl else None
+        
+        # Browser pool: each slot keeps one browser warm on its own thread and
+        # reuses it across URLs (a fresh context per proxy, not a fresh launch)
+        proxy_pool = deque(self.proxies) if self.proxies else None
+        self.browser_slots = [BrowserSlot(proxy_pool) for _ in range(browser_pool_size)]
+        self.free_slots: asyncio.Queue = asyncio.Queue()
+        for slot in self.browser_slots:
+            self.free_slots.put_nowait(slot)
         
         # Semaphore for rate limiting
         self.rate_limiter = asyncio.Semaphore(max_concurrent)
         
-        # Browser manager pool (reuse browsers)
-        self.browser_managers = []
-        self.browser_lock = asyncio.Lock()
+        # Per-host politeness: concurrency cap, earliest start time of the next
+        # request, and a lock so one request per host at a time waits for its turn
+        self.host_limiters: Dict[str, asyncio.Semaphore] = {}
+        self.host_next_slot: Dict[str, float] = {}
+        self.host_locks: Dict[str, asyncio.Lock] = {}
+        
+        # Circuit breaker state: host -> (consecutive failures, time of the last one)
+        self.host_failures: Dict[str, Tuple[int, float]] = {}
+        
+        # HTTP session, shared by every scrape_all() call (see get_session)
+        self.session: Optional[aiohttp.ClientSession] = None
+        
+        # Streamed CSV output (see open_csv); results go to self.results when none is open
+        self.csv_file = None
+        self.csv_writer: Optional[csv.DictWriter] = None
+        self.csv_rows = 0
+        self.write_queue: Optional[queue.Queue] = None
+        self.writer_thread: Optional[threading.Thread] = None
+    
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        Return the shared HTTP session, creating it on first use.
+        
+        Kept-alive connections and cached DNS answers carry over between URLs
+        and between scrape_all() calls. Call aclose() when done with the scraper.
+        """
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrent * 2, limit_per_host=self.max_per_host, ssl=False,
+                keepalive_timeout=30,  # Keep idle connections for reuse by later URLs
+                ttl_dns_cache=300,  # Keep resolved hosts for 5 minutes (aiohttp's default is 10s)
+                resolver=aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None
+            )
+            timeout = aiohttp.ClientTimeout(total=15)
+            self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self.session
+    
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
     
     def is_social_media_url(self, url: str) -> bool:
-        """Check if URL is a social media platform"""
-        url_lower = url.lower()
-        for domain in self.BLOCKED_DOMAINS:
-            if domain in url_lower:
-                return True
-        return False
+        """Check if URL's host is a social media platform (or a subdomain of one)"""
+        try:
+            # Bare hosts ('facebook.com/page') are checked too, before the scheme check rejects them
+            host = urlsplit(url if '//' in url else '//' + url).hostname or ''
+        except ValueError:  # Malformed netloc, e.g. an unclosed IPv6 bracket
+            return False
+        # Look up the host and each parent domain: m.facebook.com, facebook.com, com
+        labels = host.split('.')
+        return any('.'.join(labels[i:]) in self.BLOCKED_DOMAINS for i in range(len(labels)))
     
     def validate_url(self, url: str) -> Tuple[bool, str]:
         """
@@ -141,35 +366,50 @@ class OptimizedScraper:
         """
         Detect if page needs browser rendering.
         Returns True if heavy JavaScript detected.
+        
+        One case-insensitive scan, no parse: pages that pass are checked for
+        missing text (is_mostly_empty) on the tree parse_page builds anyway.
         """
         if not html:
             return True
         
         # Check for heavy JavaScript frameworks
-        js_indicators = [
-            'react', 'angular', 'vue.js', 'next.js',
-            '__NEXT_DATA__', 'ng-app', 'v-app',
-            'data-reactroot', 'data-react-helmet'
-        ]
-        
-        html_lower = html.lower()
-        for indicator in js_indicators:
-            if indicator in html_lower:
-                return True
-        
-        # Check if page is mostly empty (likely needs JS)
-        soup = BeautifulSoup(html, 'html.parser')
-        text = soup.get_text().strip()
-        if len(text) < 200:  # Very little content
+        if JS_INDICATOR_PATTERN.search(html):
             return True
         
-        return False
+        # Page text can't be longer than the page itself
+        return len(html) < MIN_TEXT_CHARS
+    
+    def is_mostly_empty(self, text: str) -> bool:
+        """Check if page text is too short to be the real content (likely needs JS)"""
+        return len(text.strip()) < MIN_TEXT_CHARS
+    
+    def host_circuit_open(self, host: str) -> bool:
+        """Check if a host has stopped responding recently enough to skip it"""
+        failures, last_failure = self.host_failures.get(host, (0, 0.0))
+        return failures >= self.CIRCUIT_FAILURES and time.monotonic() - last_failure < self.CIRCUIT_COOLDOWN
+    
+    def record_host_failure(self, host: str):
+        """Count a timeout or connection error against a host"""
+        failures, _ = self.host_failures.get(host, (0, 0.0))
+        self.host_failures[host] = (failures + 1, time.monotonic())
     
     async def try_http_scrape_with_retry(self, session, url):
         """Try HTTP scraping with retry logic"""
+        if self.cache is not None:
+            cached = self.cache.get(url)
+            if cached is not None:
+                self.stats['cache_hits'] += 1
+                return cached, "http_success"
+        
+        host = urlsplit(url).netloc.lower()
         last_error = None
         
         for attempt in range(self.retry_attempts):
+            # Host is down: don't spend more timeouts and backoff on it
+            if self.host_circuit_open(host):
+                return None, "circuit_open"
+            
             try:
                 timeout = aiohttp.ClientTimeout(total=10)
                 headers = {
@@ -177,73 +417,84 @@ class OptimizedScraper:
                 }
                 
                 async with session.get(url, timeout=timeout, ssl=False, headers=headers) as response:
+                    self.host_failures.pop(host, None)  # Host answered, whatever the status
                     if response.status == 200:
-                        html = await response.text()
+                        # Read the bytes once and decode leniently: one bad byte
+                        # should not fail the page (text() decodes strictly)
+                        raw = await response.read()
+                        encoding = response.charset or 'utf-8'
+                        try:
+                            html = raw.decode(encoding, errors='replace')
+                        except LookupError:  # Unknown charset name in the Content-Type header
+                            encoding = 'utf-8'
+                            html = raw.decode(encoding, errors='replace')
                         
                         # Check if browser needed
                         if self.needs_browser(html):
                             return None, "needs_browser"
                         
-                        # Parse with BeautifulSoup
-                        data = self.parse_http_response(url, html)
+                        # Parse (lxml reads the UTF-8 bytes directly)
+                        is_utf8 = codecs.lookup(encoding).name == 'utf-8'
+                        page = parse_page(html, raw if is_utf8 else None)
+                        if self.is_mostly_empty(page['text']):
+                            return None, "needs_browser"
+                        
+                        data = self.parse_http_response(url, html, page)
+                        if self.cache is not None:
+                            self.cache.set(url, data, expire=self.cache_ttl)
                         return data, "http_success"
                     else:
                         last_error = f"HTTP {response.status}"
                         
             except asyncio.TimeoutError:
                 last_error = "Timeout"
+                self.record_host_failure(host)
                 if attempt < self.retry_attempts - 1:
                     self.stats['retries'] += 1
                     await asyncio.sleep(2 ** attempt)  # Exponential backoff
                     
             except Exception as e:
                 last_error = str(e)
+                if isinstance(e, aiohttp.ClientConnectionError):  # Refused, reset, DNS failure...
+                    self.record_host_failure(host)
                 if attempt < self.retry_attempts - 1:
                     self.stats['retries'] += 1
                     await asyncio.sleep(2 ** attempt)
         
         return None, f"http_error: {last_error}"
     
-    def parse_http_response(self, url, html):
-        """Parse HTTP response quickly"""
-        soup = BeautifulSoup(html, 'html.parser')
+    def parse_http_response(self, url, html, page: Optional[Dict] = None):
+        """
+        Parse HTTP response quickly
         
-        # Extract basic data
-        title = soup.title.string if soup.title else ""
+        Args:
+            url: URL the page was fetched from
+            html: Decoded page HTML
+            page: parse_page() result for html, if already parsed
+        """
+        if page is None:
+            page = parse_page(html)
         
-        meta_desc = ""
-        meta_tag = soup.find('meta', attrs={'name': 'description'})
-        if meta_tag:
-            meta_desc = meta_tag.get('content', '')
+        # Extract basic data
+        title = page['title']
+        meta_desc = page['meta_description']
         
-        # Extract emails
-        emails = []
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        emails = re.findall(email_pattern, html)
-        emails = [e.lower() for e in emails if '@' in e and '.' in e.split('@')[1]]
-        emails = list(set(emails))[:5]
+        # Extract emails (first five distinct, in page order)
+        emails = find_all(EMAIL_SCANNER, EMAIL_PATTERN, html)
+        emails = first_unique(e.lower() for e in emails if '@' in e and '.' in e.split('@')[1])
         
         # Extract phones
-        phones = []
-        phone_pattern = r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        phones = re.findall(phone_pattern, html)
-        phones = list(set(phones))[:5]
+        phones = first_unique(find_all(PHONE_SCANNER, PHONE_PATTERN, html))
         
         # Extract social links
-        social_domains = ['facebook.com', 'instagram.com', 'twitter.com', 'linkedin.com', 'youtube.com']
-        social_links = []
-        for domain in social_domains:
-            pattern = rf'https?://(?:www\.)?{re.escape(domain)}/[^\s"\'>]+'
-            social_links.extend(re.findall(pattern, html))
-        social_links = list(set(social_links))[:5]
+        social_links = first_unique(SOCIAL_PATTERN.findall(html))
         
         # Word count
-        text = soup.get_text()
-        word_count = len(text.split())
+        word_count = len(page['text'].split())
         
         # Features
-        has_form = bool(soup.find('form'))
-        has_blog = bool(re.search(r'blog|article', html, re.IGNORECASE))
+        has_form = page['has_form']
+        has_blog = bool(BLOG_PATTERN.search(html))
         
         return {
             'url': url,
@@ -258,145 +509,92 @@ class OptimizedScraper:
             'method': 'http'
         }
     
-    async def get_browser_manager(self):
-        """Get or create a browser manager from the pool"""
-        async with self.browser_lock:
-            if self.browser_managers:
-                return self.browser_managers.pop()
-            
-            # Create new browser manager
-            proxy_config = get_next_proxy() if self.proxies else None
-            browser_manager = BrowserManager(proxy_config)
-            browser_manager.launch_browser()
-            return browser_manager
-    
-    async def return_browser_manager(self, browser_manager):
-        """Return browser manager to pool"""
-        async with self.browser_lock:
-            if len(self.browser_managers) < self.browser_pool_size:
-                self.browser_managers.append(browser_manager)
-            else:
-                # Pool is full, close this one
-                browser_manager.close_browser()
-    
     async def browser_scrape_async(self, url):
-        """Browser scraping in thread pool (non-blocking)"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self.executor,
-            self.browser_scrape_sync,
-            url
-        )
-    
-    def browser_scrape_sync(self, url):
-        """Synchronous browser scraping (runs in thread)"""
-        browser_manager = None
+        """Browser scraping on a free pooled browser (non-blocking)"""
+        slot = await self.free_slots.get()
         try:
-            # Get proxy
-            proxy_config = get_next_proxy() if self.proxies else None
-            
-            # Launch browser
-            browser_manager = BrowserManager(proxy_config)
-            browser_manager.launch_browser()
-            
-            # Load page
-            if not browser_manager.load_page(url):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(slot.executor, self.browser_scrape_sync, slot, url)
+        finally:
+            self.free_slots.put_nowait(slot)
+    
+    def browser_scrape_sync(self, slot, url):
+        """Synchronous browser scraping (runs on the slot's thread)"""
+        try:
+            # Load, scroll and extract (using existing accurate functions)
+            scraped = slot.scrape(url, False)
+            if scraped is None:
                 return None
-            
-            # Scroll
-            browser_manager.scroll_to_bottom()
-            
-            # Extract data
-            page = browser_manager.page
-            
-            extracted_url = extract_url(page)
-            title = extract_title(page)
-            metadata = extract_metadata(page)
-            emails = extract_emails(page)
-            phones = extract_phones(page)
-            address_data = extract_address(page)
-            social_links = extract_social_links(page)
-            external_links = extract_external_links(page)
-            description = extract_descriptions(page)
-            messaging = extract_messaging_links(page)
-            
-            industry = infer_industry(page)
-            contact_form = detect_contact_form(page)
-            word_count = calculate_word_count(page)
-            blog_present = detect_blog(page)
-            products_or_services = detect_products_services(page)
-            
-            timestamp = generate_timestamp()
-            
-            # Clean data
-            emails = clean_text(normalize_data(emails))
-            phones = clean_text(phones)
-            social_links = clean_text(normalize_data(social_links))
-            external_links = clean_text(normalize_data(external_links))
-            emails, phones = apply_defaults(emails, phones)
-            
-            # Calculate metrics
-            email_count = len(emails) if isinstance(emails, list) else 0
-            phone_count = len(phones) if isinstance(phones, list) else 0
-            social_count = len(social_links) if isinstance(social_links, list) else 0
-            
-            # Format address: use full address with country if available
-            address_str = address_data.get('full', '')
-            if not address_str and address_data.get('country'):
-                # If no full address but have country, just use country
-                address_str = address_data.get('country', '')
-            
-            return {
-                'url': extracted_url,
-                'title': title,
-                'emails': emails,
-                'phones': phones,
-                'social_links': social_links,
-                'external_links': external_links,
-                'description': description,
-                'meta_description': metadata.get('meta_description', ''),
-                'og_title': metadata.get('og_title', ''),
-                'og_description': metadata.get('og_description', ''),
-                'og_image': metadata.get('og_image', ''),
-                'address': address_str,  # Single address field
-                'whatsapp': messaging.get('whatsapp', ''),
-                'telegram': messaging.get('telegram', ''),
-                'signal': messaging.get('signal', ''),
-                'discord': messaging.get('discord', ''),
-                'contact_form': contact_form,
-                'industry': industry,
-                'blog_present': blog_present,
-                'products_or_services': products_or_services,
-                'word_count': word_count,
-                'scrape_timestamp': timestamp,
-                'email_count': email_count,
-                'phone_count': phone_count,
-                'social_count': social_count,
-                'method': 'browser'
-            }
+            data = asdict(scraped)
+            data['method'] = 'browser'
+            return data
             
         except Exception as e:
             logger.error(f"Browser scraping failed for {url}: {e}")
+            # Drop the browser so the slot relaunches a clean one for its next URL
+            try:
+                slot.close()
+            except Exception:
+                slot.browser_manager = None
             return None
+    
+    async def close_browsers(self):
+        """Close every pooled browser, each on the thread that launched it"""
+        loop = asyncio.get_running_loop()
+        for slot in self.browser_slots:
+            await loop.run_in_executor(slot.executor, slot.close)
+    
+    async def wait_for_host(self, host: str):
+        """Sleep until the host's next request may start"""
+        if self.rate_limit_delay <= 0:
+            return
+        delay = self.host_next_slot.get(host, 0.0) - asyncio.get_running_loop().time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    @asynccontextmanager
+    async def host_turn(self, host: str):
+        """
+        Hold a slot for one request to a host.
+        
+        Requests to the same host start at least rate_limit_delay apart, with
+        at most max_per_host in flight; other hosts are not delayed. The
+        host's lock is held through the wait until both the host's limiter and
+        a global slot are taken, and only then is its next start time set, so
+        the spacing is measured from when requests actually start. The wait
+        itself holds no global slot, so a long run of one host's URLs cannot
+        keep every slot idle while other hosts wait.
+        """
+        host_limiter = self.host_limiters.setdefault(host, asyncio.Semaphore(self.max_per_host))
+        async with self.host_locks.setdefault(host, asyncio.Lock()):
+            await self.wait_for_host(host)
+            await host_limiter.acquire()
+            try:
+                await self.rate_limiter.acquire()
+            except BaseException:
+                host_limiter.release()
+                raise
+            self.host_next_slot[host] = asyncio.get_running_loop().time() + self.rate_limit_delay
+        try:
+            yield
         finally:
-            if browser_manager:
-                browser_manager.close_browser()
+            self.rate_limiter.release()
+            host_limiter.release()
     
     async def scrape_url(self, session, url, index, total):
         """Scrape a single URL with optimized hybrid approach"""
-        async with self.rate_limiter:
+        # Validate URL first
+        is_valid, error_msg = self.validate_url(url)
+        if not is_valid:
+            print(f"\n[{index}/{total}] {url}")
+            print(f"  ✗ SKIPPED: {error_msg}")
+            self.stats['skipped'] += 1
+            return {'url': url, 'status': 'skipped', 'reason': error_msg}
+        
+        # Rate limiting (per host; other hosts are not delayed)
+        host = urlsplit(url).netloc.lower()
+        async with self.host_turn(host):
             print(f"\n[{index}/{total}] {url}")
-            
-            # Validate URL first
-            is_valid, error_msg = self.validate_url(url)
-            if not is_valid:
-                print(f"  ✗ SKIPPED: {error_msg}")
-                self.stats['skipped'] += 1
-                return {'url': url, 'status': 'skipped', 'reason': error_msg}
-            
-            # Rate limiting
-            if self.rate_limit_delay > 0:
-                await asyncio.sleep(self.rate_limit_delay)
             
             # Force browser mode
             if self.force_browser:
@@ -418,6 +616,12 @@ class OptimizedScraper:
                 self.stats['http_success'] += 1
                 return data
             
+            elif status == "circuit_open":
+                # Host isn't answering; a browser would only time out as well
+                print(f"  ✗ FAILED: {host} is not responding")
+                self.stats['failed'] += 1
+                return {'url': url, 'status': 'failed', 'reason': 'host not responding'}
+            
             elif status == "needs_browser":
                 print(f"  → JavaScript detected, switching to BROWSER...")
                 data = await self.browser_scrape_async(url)
@@ -451,38 +655,101 @@ class OptimizedScraper:
         print(f"URLs to scrape: {len(urls)}")
         print(f"Max concurrent: {self.max_concurrent}")
         print(f"Retry attempts: {self.retry_attempts}")
-        print(f"Rate limit: {self.rate_limit_delay}s")
+        print(f"Rate limit: {self.rate_limit_delay}s per host, {self.max_per_host} at a time")
         print(f"Strategy: Parallel HTTP → Browser fallback")
         print("=" * 60)
         
-        timeout = aiohttp.ClientTimeout(total=15)
-        connector = aiohttp.TCPConnector(limit=self.max_concurrent * 2, ssl=False)
+        session = await self.get_session()
         
-        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        # Alternate hosts so a list grouped by domain doesn't start with every
+        # task queued on the same host while the others wait
+        urls = interleave_by_host(urls)
+        
+        try:
             # Create tasks for parallel execution
             tasks = [
                 self.scrape_url(session, url, i, len(urls))
                 for i, url in enumerate(urls, 1)
             ]
             
-            # Execute in parallel with progress
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"Task failed with exception: {result}")
+            # Execute in parallel, handing each result on as soon as it finishes
+            for task in asyncio.as_completed(tasks):
+                try:
+                    result = await task
+                except Exception as e:
+                    logger.error(f"Task failed with exception: {e}")
                     self.stats['failed'] += 1
-                elif result:
-                    self.results.append(result)
+                    continue
+                if result:
+                    await self.add_result(result)
+        finally:
+            # Cleanup browser pool
+            await self.close_browsers()
         
         self.stats['end_time'] = time.time()
+    
+    async def open_csv(self, filename):
+        """
+        Stream results to a CSV as they complete, instead of keeping them for save_to_csv()
         
-        # Cleanup browser pool
-        async with self.browser_lock:
-            for bm in self.browser_managers:
-                bm.close_browser()
-            self.browser_managers.clear()
+        Rows are written in completion order by one writer thread, which owns
+        the file, so formatting and disk writes stay off the event loop. Each
+        row is flushed as it goes, so a crash or Ctrl+C keeps everything
+        scraped so far.
+        """
+        self.csv_file = open(filename, 'w', newline='', encoding='utf-8')
+        self.csv_writer = csv.DictWriter(self.csv_file, fieldnames=CSV_FIELDNAMES, extrasaction='ignore')
+        self.csv_writer.writeheader()
+        self.csv_rows = 0
+        self.write_queue = queue.Queue(maxsize=1024)
+        self.writer_thread = threading.Thread(target=self.write_rows, name='csv-writer', daemon=True)
+        self.writer_thread.start()
+    
+    def write_rows(self):
+        """Write queued results to the open CSV until the None sentinel arrives (writer thread)"""
+        while True:
+            result = self.write_queue.get()
+            if result is None:
+                return
+            try:
+                self.csv_writer.writerow(format_csv_row(result))
+                self.csv_file.flush()
+                self.csv_rows += 1
+            except Exception as e:
+                # Keep draining the queue so scraping never blocks on a full one
+                logger.error(f"Failed to write CSV row for {result.get('url')}: {e}")
+    
+    async def put_row(self, item: Optional[Dict]):
+        """Hand an item to the writer thread, waiting off the event loop if its queue is full"""
+        try:
+            self.write_queue.put_nowait(item)
+        except queue.Full:
+            await asyncio.get_running_loop().run_in_executor(None, self.write_queue.put, item)
+    
+    async def add_result(self, result: Dict):
+        """Queue a result for the open CSV, or keep it in self.results if none is open"""
+        if self.write_queue is None:
+            self.results.append(result)
+            return
+        await self.put_row(result)
+    
+    async def close_csv(self):
+        """Finish writing queued rows, sync them to disk and close the CSV opened by open_csv()"""
+        if self.csv_file is None:
+            return
+        try:
+            await self.put_row(None)
+            await asyncio.get_running_loop().run_in_executor(None, self.writer_thread.join)
+            self.csv_file.flush()
+            os.fsync(self.csv_file.fileno())
+        finally:
+            self.csv_file.close()
+            print(f"\n[+] {self.csv_rows} results saved to: {self.csv_file.name}")
+            logger.info(f"Results saved to: {self.csv_file.name}")
+            self.csv_file = None
+            self.csv_writer = None
+            self.write_queue = None
+            self.writer_thread = None
     
     def save_to_csv(self, filename):
         """Save results to CSV"""
@@ -490,24 +757,12 @@ class OptimizedScraper:
             print("\n[!] No results to save")
             return
         
-        # Determine fieldnames based on data
-        all_keys = set()
-        for result in self.results:
-            all_keys.update(result.keys())
-        
-        fieldnames = sorted(list(all_keys))
-        
-        # Format list fields
-        for result in self.results:
-            for key, value in result.items():
-                if isinstance(value, list):
-                    result[key] = '; '.join(str(v) for v in value) if value else ""
-        
         # Always create new file with headers
         with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES, extrasaction='ignore')
             writer.writeheader()
-            writer.writerows(self.results)
+            # List fields are joined as each row is written; self.results is left as scraped
+            writer.writerows(map(format_csv_row, self.results))
         
         print(f"\n[+] Results saved to: {filename}")
         logger.info(f"Results saved to: {filename}")
@@ -527,6 +782,8 @@ class OptimizedScraper:
         print(f"Skipped:           {self.stats['skipped']}")
         print(f"Failed:            {self.stats['failed']}")
         print(f"Retries:           {self.stats['retries']}")
+        if self.cache is not None:
+            print(f"Cache hits:        {self.stats['cache_hits']}")
         if self.stats['total'] > 0:
             print(f"Success Rate:      {(total_success/self.stats['total']*100):.1f}%")
         if elapsed > 0 and total_success > 0:
@@ -539,7 +796,10 @@ class OptimizedScraper:
     
     def cleanup(self):
         """Cleanup resources"""
-        self.executor.shutdown(wait=True)
+        for slot in self.browser_slots:
+            slot.executor.shutdown(wait=True)
+        if self.cache is not None:
+            self.cache.close()
 
 
 async def main():
@@ -556,7 +816,13 @@ async def main():
     parser.add_argument('--retry', type=int, default=2,
                        help='Retry attempts for failed requests (default: 2)')
     parser.add_argument('--rate-limit', type=float, default=0.5,
-                       help='Delay between requests in seconds (default: 0.5)')
+                       help='Delay between requests to the same host in seconds (default: 0.5)')
+    parser.add_argument('--max-per-host', type=int, default=2,
+                       help='Max concurrent requests to one host (default: 2)')
+    parser.add_argument('--cache-ttl', type=int, default=86400,
+                       help='Seconds to reuse cached HTTP results, needs diskcache (default: 86400)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always re-fetch pages instead of using cached results')
     parser.add_argument('--browser-pool', type=int, default=3,
                        help='Browser pool size (default: 3)')
     
@@ -590,7 +856,7 @@ async def main():
             return
         
         # Pre-validate URLs and warn user
-        scraper_temp = OptimizedScraper()
+        scraper_temp = OptimizedScraper(cache_ttl=0)
         invalid_urls = []
         for url in urls[:]:
             is_valid, error_msg = scraper_temp.validate_url(url)
@@ -614,34 +880,41 @@ async def main():
         max_concurrent=args.max_concurrent,
         retry_attempts=args.retry,
         rate_limit_delay=args.rate_limit,
-        browser_pool_size=args.browser_pool
+        browser_pool_size=args.browser_pool,
+        max_per_host=args.max_per_host,
+        cache_ttl=0 if args.no_cache else args.cache_ttl
     )
     
+    # Save (rows are written as each URL finishes)
+    if args.output:
+        csv_filename = args.output
+    else:
+        # Generate timestamped filename for each run
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        csv_filename = f"optimized_scrape_{timestamp}.csv"
+    
     try:
+        await scraper.open_csv(csv_filename)
+        
         # Scrape
         await scraper.scrape_all(urls)
-        
-        # Save
-        if args.output:
-            csv_filename = args.output
-        else:
-            # Generate timestamped filename for each run
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            csv_filename = f"optimized_scrape_{timestamp}.csv"
-        
-        scraper.save_to_csv(csv_filename)
+        await scraper.close_csv()
         scraper.print_stats()
         
     finally:
+        await scraper.close_csv()
+        await scraper.aclose()
         scraper.cleanup()
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        if UVLOOP_AVAILABLE:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         print("\n[!] Interrupted by user")
         logger.info("Scraping interrupted by user")
     finally:
-        import os
         os._exit(0)